@@ -1,4 +1,11 @@
+import asyncio
+from collections.abc import (
+    Callable,
+    Generator,
+)
+from functools import partial
 from itertools import chain
+from test.utils import tool_utils
 from test.utils.db_objects import (
     ExaBfsDir,
     ExaBfsFile,
@@ -13,6 +20,7 @@ from test.utils.db_objects import (
 from test.utils.mcp_oidc_constants import DOCKER_DB_NAME
 from test.utils.sql_utils import format_table_rows
 from textwrap import dedent
+from typing import Any
 
 import exasol.bucketfs as bfs
 import pytest
@@ -45,6 +53,24 @@ def run_on_saas(backend) -> None:
         pytest.skip()
 
 
+@pytest.fixture(scope="session")
+def event_loop_runner() -> Generator[asyncio.Runner, None, None]:
+    """
+    Provides an event loop shared by all tests, so that the loop is not recreated
+    in every call to an MCP server.
+    """
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def run_tool(event_loop_runner) -> Callable[..., Any]:
+    """
+    Provides the `run_tool` test utility bound to the session event loop.
+    """
+    return partial(tool_utils.run_tool, runner=event_loop_runner)
+
+
 @pytest.fixture(scope="session")
 def database_name(backend, project_short_tag):
     """
@@ -1,12 +1,9 @@
 import ssl
-from test.utils.multiprocessing_utils import use_fork_start_method
+from test.utils.multiprocessing_utils import run_server_in_forked_process
 
 import httpx
 import pytest
-from fastmcp.utilities.tests import (
-    find_available_port,
-    run_server_in_process,
-)
+from fastmcp.utilities.tests import find_available_port
 
 from exasol.ai.mcp.server.connection.connection_factory import (
     ENV_DSN,
@@ -19,16 +16,6 @@ from exasol.ai.mcp.server.main import create_mcp_server
 from exasol.ai.mcp.server.setup.server_settings import McpServerSettings
 
 
-@pytest.fixture(autouse=True)
-def _use_fork_start_method(monkeypatch):
-    """
-    ``run_server_in_process`` below relies on "fork" semantics (shared memory,
-    no pickling) to run the nested closure returned by ``_mcp_server_factory``.
-    See ``use_fork_start_method`` for why this is needed since Python 3.14.
-    """
-    use_fork_start_method(monkeypatch)
-
-
 def _mcp_server_factory(env: dict[str, str]):
 
     def server_factory(host: str, port: int) -> None:
@@ -61,7 +48,7 @@ def test_health_check(
     if not valid_password:
         env[ENV_PASSWORD] += "^^^"
     port = find_available_port()
-    with run_server_in_process(_mcp_server_factory(env), port=port):
+    with run_server_in_forked_process(_mcp_server_factory(env), port=port):
         url = f"http://localhost:{port}/health"
         response = httpx.request("GET", url)
         response.raise_for_status()
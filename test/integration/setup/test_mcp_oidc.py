@@ -18,12 +18,14 @@ In order to set up the tests the following steps are performed:
    It must be provided as a parameter to the ITDE when an instance of the DockerDB is
    spawned. This happens in the pytest plugin and controlled from a GitHub workflow.
 
-4. Start the MCP Server with the http transport, in a separate process. The server
-   will use different OpenID parameters depending on the test.
+4. Start the MCP Server with the http transport, in a background thread. The server
+   will use different OpenID parameters depending on the test. A server started with
+   a particular combination of the OpenID and connection parameters is kept running
+   until the end of the session and shared by all tests that need this combination.
 
 5. Start the MCP Client with OAuth2 support, call a tool and validate the result.
 
-The last two steps are repeated in each test, since we are going to test different
+The last step is repeated in each test, since we are going to test different
 modes in regard to the OpenID setup.
 
 We test three FastMCP options for the OpenID setup. In two of them the server
@@ -53,31 +55,34 @@ the url passed to the OAuth.redirect_handler.
 """
 
 import asyncio
+import functools
 import json
-import multiprocessing
+import os
 import ssl
+import threading
 import time
-from collections.abc import Generator
+from collections.abc import (
+    Callable,
+    Generator,
+)
 from contextlib import (
     ExitStack,
     contextmanager,
 )
 from test.utils.db_objects import ExaSchema
 from test.utils.mcp_oidc_constants import *
-from test.utils.multiprocessing_utils import use_fork_start_method
+from test.utils.server_utils import run_server_in_thread
+from typing import TYPE_CHECKING
 from unittest.mock import patch
-from urllib.parse import quote
 
-import docker
 import httpx
 import joserfc.jwk as jose
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
-from authlib.integrations.flask_oauth2 import AuthorizationServer
-from authlib.jose.rfc7518 import RSAKey as _AuthlibRSAKey
-from authlib.oauth2.rfc9068 import JWTBearerTokenGenerator
-from docker.models.containers import Container
-from fastmcp import Client
+from fastmcp import (
+    Client,
+    FastMCP,
+)
 from fastmcp.client.auth.oauth import OAuth
 from fastmcp.client.transports import StreamableHttpTransport
 from fastmcp.server.auth import (
@@ -86,16 +91,7 @@ from fastmcp.server.auth import (
     RemoteAuthProvider,
 )
 from fastmcp.server.auth.providers.jwt import JWTVerifier
-from fastmcp.utilities.tests import run_server_in_process
-from oidc_provider_mock._app import (
-    _JWS_ALG,
-    app,
-)
-from oidc_provider_mock._server import _threaded_server
-from oidc_provider_mock._storage import (
-    Storage,
-    User,
-)
+from fastmcp.utilities.tests import find_available_port
 from pyexasol import (
     ExaConnection,
     ExaRequestError,
@@ -129,18 +125,17 @@ from exasol.ai.mcp.server.setup.server_settings import (
 )
 from exasol.ai.mcp.server.tools.schema.db_output_schema import NAME_FIELD
 
-AUTH_SCOPE = "openid"
+if TYPE_CHECKING:
+    from docker import DockerClient
+    from docker.models.containers import Container
 
 
-@pytest.fixture(autouse=True)
-def _use_fork_start_method(monkeypatch):
-    """
-    The MCP server launcher and the OAuth redirect handler in this module rely
-    on "fork" semantics (shared memory, no pickling) to run local closures -
-    and a live ``monkeypatch`` fixture - in a child process. See
-    ``use_fork_start_method`` for why this is needed since Python 3.14.
-    """
-    use_fork_start_method(monkeypatch)
+AUTH_SCOPE = "openid"
+OIDC_KEY_CACHE = "oidc/jwk"
+OIDC_KEY_MAX_AGE = 7 * 24 * 3600
+NO_CURL_OUTPUT = "NO_CURL"
+KEEP_NETWORK_ENV = "MCP_KEEP_TEST_NETWORK"
+CALLBACK_MAX_RETRIES = 4
 
 
 def _validate_db_oidc_setup(pyexasol_connection: ExaConnection) -> None:
@@ -164,6 +159,22 @@ def _validate_db_oidc_setup(pyexasol_connection: ExaConnection) -> None:
         print("Warning: unable to read JWK endpoint from the database")
 
 
+def _execute_in_transaction(connection: ExaConnection, queries: list[str]) -> None:
+    """
+    Executes the queries with the autocommit switched off, committing them only once.
+    """
+    connection.set_autocommit(False)
+    try:
+        for query in queries:
+            connection.execute(query)
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.set_autocommit(True)
+
+
 @pytest.fixture(scope="session")
 def create_users(run_on_itde, pyexasol_connection) -> None:
     """
@@ -180,19 +191,20 @@ def create_users(run_on_itde, pyexasol_connection) -> None:
     grant_query3 = f'GRANT IMPERSONATE ANY USER TO "{SERVER_USER_NAME}"'
     drop_query1 = f'DROP USER IF EXISTS "{OIDC_USER_NAME}" CASCADE'
     drop_query2 = f'DROP USER IF EXISTS "{SERVER_USER_NAME}" CASCADE'
-    for query in [
-        drop_query1,
-        drop_query2,
-        create_query1,
-        create_query2,
-        grant_query1,
-        grant_query2,
-        grant_query3,
-    ]:
-        pyexasol_connection.execute(query)
+    _execute_in_transaction(
+        pyexasol_connection,
+        [
+            drop_query1,
+            drop_query2,
+            create_query1,
+            create_query2,
+            grant_query1,
+            grant_query2,
+            grant_query3,
+        ],
+    )
     yield
-    for query in [drop_query1, drop_query2]:
-        pyexasol_connection.execute(query)
+    _execute_in_transaction(pyexasol_connection, [drop_query1, drop_query2])
 
 
 class OAuthHeadless(OAuth):
@@ -203,42 +215,65 @@ class OAuthHeadless(OAuth):
     and submit the authorization automatically.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, http_client: httpx.Client, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self._http_client = http_client
+        self._pending_auth_threads: list[threading.Thread] = []
 
     @staticmethod
     def _is_oidc_server_url(url: str) -> bool:
         return f":{OIDC_PORT}" in url
 
+    def _call_redirect_uri(self, redirect_uri: str) -> None:
+        # The client starts its callback server only after the redirect handler
+        # returns. Retry the call with an exponential backoff until the server is up.
+        delay = 0.1
+        for _ in range(CALLBACK_MAX_RETRIES):
+            try:
+                self._http_client.get(redirect_uri)
+                return
+            except httpx.ConnectError:
+                time.sleep(delay)
+                delay *= 2
+        self._http_client.get(redirect_uri)
+
     async def redirect_handler(self, authorization_url: str) -> None:
         # The code below is a replacement for
         # webbrowser.open(authorization_url)
         def send_authorization_request():
-            with httpx.Client() as client:
-                time.sleep(1)
-                if not self._is_oidc_server_url(authorization_url):
-                    # Here authorization url is a URL of a proxy. We need to get to its
-                    # redirection URL before submitting the "user authorization".
-                    # Starting from FastMCP 2.13, this trick no longer works!
-                    response = client.get(authorization_url)
-                    assert 300 <= response.status_code < 400
-                    assert response.has_redirect_location
-                    server_auth_url = response.headers["location"]
-                    assert self._is_oidc_server_url(server_auth_url)
-                else:
-                    server_auth_url = authorization_url
-                client.post(
-                    server_auth_url, data={"sub": OIDC_USER_SUB}, follow_redirects=True
-                )
+            if not self._is_oidc_server_url(authorization_url):
+                # Here authorization url is a URL of a proxy. We need to get to its
+                # redirection URL before submitting the "user authorization".
+                # Starting from FastMCP 2.13, this trick no longer works!
+                response = self._http_client.get(authorization_url)
+                assert 300 <= response.status_code < 400
+                assert response.has_redirect_location
+                server_auth_url = response.headers["location"]
+                assert self._is_oidc_server_url(server_auth_url)
+            else:
+                server_auth_url = authorization_url
+            response = self._http_client.post(
+                server_auth_url, data={"sub": OIDC_USER_SUB}
+            )
+            assert response.has_redirect_location
+            self._call_redirect_uri(response.headers["location"])
+
+        # The authorization is pure I/O, so a thread is sufficient for running it.
+        thread = threading.Thread(target=send_authorization_request, daemon=True)
+        self._pending_auth_threads.append(thread)
+        thread.start()
 
-        process = multiprocessing.Process(target=send_authorization_request)
-        process.start()
+    def join_pending_auth_threads(self, timeout: float = 1.0) -> None:
+        for thread in self._pending_auth_threads:
+            thread.join(timeout=timeout)
+        self._pending_auth_threads.clear()
 
 
 @contextmanager
-def start_oidc_server() -> Generator[None, None, str]:
+def start_oidc_server(jwk: jose.RSAKey | None = None) -> Generator[None, None, str]:
     """
-    The fixture starts the mock authorization server.
+    The fixture starts the mock authorization server. It will use the provided
+    private key for signing the tokens, or generate a new one if the key is not given.
 
     Few patches are required.
 
@@ -260,10 +295,32 @@ def start_oidc_server() -> Generator[None, None, str]:
     such as the authorization code grant, the value of "sub" SHOULD correspond to the
     subject identifier of the resource owner". Hence, we need to add a `get_user_id`
     function to the User.
-    """
+
+    The key set served at the /jwks endpoint never changes, so its json response is
+    built only once.
+    """
+    # The mock server and its dependencies are only needed by the tests in this module.
+    # They are imported here, to keep them out of the collection of other tests.
+    import flask
+    from authlib.integrations.flask_oauth2 import AuthorizationServer
+    from authlib.jose.rfc7518 import RSAKey as _AuthlibRSAKey
+    from authlib.oauth2.rfc9068 import JWTBearerTokenGenerator
+    from oidc_provider_mock._app import (
+        _JWS_ALG,
+        app,
+    )
+    from oidc_provider_mock._server import _threaded_server
+    from oidc_provider_mock._storage import (
+        Storage,
+        User,
+    )
+
     original_init_app = AuthorizationServer.init_app
     original_storage_init = Storage.__init__
-    jwk = jose.RSAKey.generate_key(private=True)
+    if jwk is None:
+        jwk = jose.RSAKey.generate_key(private=True)
+    jwks = jose.KeySet([jwk])
+    jwks_response = json.dumps(jwks.as_dict()).encode()
     # oidc-provider-mock calls .as_dict(is_private=True) (authlib API) on storage.jwk.
     # joserfc 1.7.x renamed the parameter from private=None to private=False, so passing
     # is_private=True as a kwarg silently defaults to public-only export. Use an authlib
@@ -272,7 +329,7 @@ def start_oidc_server() -> Generator[None, None, str]:
 
     class MyJWTBearerTokenGenerator(JWTBearerTokenGenerator):
         def get_jwks(self):
-            return jose.KeySet([jwk])
+            return jwks
 
         def get_audiences(self, client, user, scope):
             return TOKEN_AUDIENCE
@@ -310,6 +367,16 @@ def start_oidc_server() -> Generator[None, None, str]:
             require_client_registration=False,
             require_nonce=False,
             issue_refresh_token=True,
+            # Create the MCP User credentials at the mock authorization server.
+            user_claims=[
+                User(
+                    sub=OIDC_USER_SUB,
+                    claims={"name": "MCP_Test", TOKEN_USERNAME: OIDC_USER_NAME},
+                )
+            ],
+        )
+        auth_app.view_functions["oidc-provider-mock.jwks"] = lambda: flask.Response(
+            jwks_response, mimetype="application/json"
         )
         stack.enter_context(
             _threaded_server(host="0.0.0.0", port=OIDC_PORT, app=auth_app)
@@ -320,58 +387,102 @@ def start_oidc_server() -> Generator[None, None, str]:
         # the host will connect to it through the localhost.
         server_url = f"http://localhost:{OIDC_PORT}"
         print(f"✓ Authorization server started at {server_url}")
-
-        # Create the MCP User credentials at the mock authorization server.
-        response = httpx.put(
-            f"{server_url}/users/{quote(OIDC_USER_SUB)}",
-            json={"name": "MCP_Test", TOKEN_USERNAME: OIDC_USER_NAME},
-        )
-        assert response.status_code == 204
-        print("✓ The user credentials are created")
         yield server_url
 
 
+def _get_oidc_key(cache: pytest.Cache) -> jose.RSAKey:
+    """
+    Generating an RSA key is relatively expensive. The key is persisted in the pytest
+    cache and reused in subsequent runs, until the cache is cleared or the key gets
+    older than `OIDC_KEY_MAX_AGE`.
+    """
+    cached = cache.get(OIDC_KEY_CACHE, None)
+    if (
+        isinstance(cached, dict)
+        and ("created" in cached)
+        and (time.time() - cached["created"] < OIDC_KEY_MAX_AGE)
+    ):
+        return jose.RSAKey.import_key(cached["key"])
+    jwk = jose.RSAKey.generate_key(private=True)
+    cache.set(
+        OIDC_KEY_CACHE, {"key": jwk.as_dict(private=True), "created": time.time()}
+    )
+    return jwk
+
+
 @pytest.fixture(scope="session")
-def oidc_server(run_on_itde) -> str:
-    with start_oidc_server() as server_url:
+def oidc_server(request, run_on_itde) -> str:
+    with start_oidc_server(_get_oidc_key(request.config.cache)) as server_url:
         yield server_url
 
 
-def _verify_docker_network(container: Container) -> None:
+def _probe_jwk_endpoint(container: "Container") -> tuple[int, str]:
     """
-    Verifies that JWK endpoint is accessible from the DockerDB.
-    The function relies on curl being installed in the ITDE. We will first
-    check if this is the case. If not, the verification will be skipped.
+    Calls the JWK endpoint from the DockerDB and returns the exit code and the output
+    of the call, which is the HTTP status code. The call relies on curl being installed
+    in the ITDE. If this is not the case the output will be `NO_CURL_OUTPUT`. Both the
+    check and the call are made in a single command executed in the container.
     """
-    command = ["curl", "--version"]
-    exec_result = container.exec_run(command)
-    if exec_result.exit_code != 0:
-        print("Warning: Unable to verify the JWK endpoint access from the DockerDB")
-        return
     command = [
-        "curl",
-        "-s",
-        "-o",
-        "/dev/null",
-        "-w",
-        "%{http_code}",
-        DOCKER_JWK_URL,
+        "sh",
+        "-c",
+        (
+            "if command -v curl > /dev/null; "
+            f'then curl -s -o /dev/null -w "%{{http_code}}" {DOCKER_JWK_URL}; '
+            f"else echo {NO_CURL_OUTPUT}; fi"
+        ),
     ]
     exec_result = container.exec_run(command)
-    if exec_result.exit_code == 0:
-        status_code = int(exec_result.output.decode("utf-8"))
+    return exec_result.exit_code, exec_result.output.decode("utf-8").strip()
+
+
+def _verify_docker_network_once(container: "Container") -> bool | None:
+    """
+    Verifies that JWK endpoint is accessible from the DockerDB.
+    Returns True if the endpoint is accessible, False if it is not, and None if the
+    verification is not possible, because curl is not installed in the ITDE.
+    """
+    exit_code, output = _probe_jwk_endpoint(container)
+    if output == NO_CURL_OUTPUT:
+        print("Warning: Unable to verify the JWK endpoint access from the DockerDB")
+        return None
+    elif exit_code == 0:
+        status_code = int(output)
         if 200 <= status_code < 300:
             print(
                 f"✓ JWK endpoint is accessible from the DockerDB: HTTP code {status_code}"
             )
-        else:
-            raise RuntimeError(
-                f"JWK endpoint is inaccessible from the DockerDB: HTTP code {status_code}"
-            )
-    else:
-        raise RuntimeError(
-            f"Failed to call JWK endpoint from the DockerDB: exit code {exec_result.exit_code}"
+            return True
+        print(
+            f"JWK endpoint is inaccessible from the DockerDB: HTTP code {status_code}"
         )
+    else:
+        print(f"Failed to call JWK endpoint from the DockerDB: exit code {exit_code}")
+    return False
+
+
+def _verify_docker_network(container: "Container", timeout: float = 0) -> None:
+    """
+    Verifies that JWK endpoint is accessible from the DockerDB, retrying the check
+    every 100 ms until the timeout, which gives the network time to initialize.
+    If the verification is not possible, the function just waits for the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while not (verified := _verify_docker_network_once(container)):
+        remaining = deadline - time.monotonic()
+        if verified is None:
+            time.sleep(max(remaining, 0))
+            return
+        if remaining <= 0:
+            raise RuntimeError("JWK endpoint is inaccessible from the DockerDB")
+        time.sleep(min(0.1, remaining))
+
+
+@functools.cache
+def _get_docker_client() -> "DockerClient":
+    import docker
+
+    return docker.from_env()
 
 
 @pytest.fixture(scope="session")
@@ -379,14 +490,20 @@ def setup_docker_network(run_on_itde, oidc_server):
     """
     The fixture sets up the networking for the DockerDB, allowing it to connect to the
     mock authorization server. The DB will fetch the token encryption key from it.
+    If the environment variable MCP_KEEP_TEST_NETWORK is set, the network is not removed
+    at the end of the session, which makes the setup instant in subsequent runs.
     """
-    client = docker.from_env()
+    import docker
+
+    client = _get_docker_client()
     network_name = "oidc-test-bridge-network"
 
+    # The container is inspected only once. Its attributes are reused below.
     container = client.containers.get(CONTAINER_NAME)
-    # Create or get a custom docker network
+    # Create or get a custom docker network. The network is then referred to by name,
+    # using the low-level API, which saves inspecting it after the creation.
     try:
-        network = client.networks.create(
+        client.api.create_network(
             name=network_name,
             driver="bridge",
             ipam=docker.types.IPAMConfig(
@@ -396,43 +513,54 @@ def setup_docker_network(run_on_itde, oidc_server):
         print(f"✓ Created docker network: {network_name}")
     except docker.errors.APIError:
         # Try to use the existing network.
-        network = client.networks.get(network_name)
         print(f"✓ Using existing docker network: {network_name}")
 
     # Connect container to the network
     current_networks = container.attrs["NetworkSettings"]["Networks"]
     if network_name not in current_networks:
-        network.connect(container)
+        client.api.connect_container_to_network(container.id, network_name)
         print(f"✓ Connected container {CONTAINER_NAME} to {network_name}")
         # Allow network to initialize
-        time.sleep(2)
+        _verify_docker_network(container, timeout=2.0)
     else:
         print(f"✓ Container {CONTAINER_NAME} is already in {network_name}")
-
-    _verify_docker_network(container)
+        _verify_docker_network(container)
     yield
 
+    if os.environ.get(KEEP_NETWORK_ENV):
+        print(f"✓ Keeping {CONTAINER_NAME} connected to {network_name}")
+        return
     # Cleanup
-    network.disconnect(container)
+    client.api.disconnect_container_from_network(container.id, network_name)
     print(f"✓ Disconnected {CONTAINER_NAME} from {network_name}")
-    network.remove()
+    client.api.remove_network(network_name)
     print(f"✓ Deleted network: {network_name}")
 
 
-def _set_auth_type(monkeypatch: MonkeyPatch, provider_type: type[AuthProvider]):
-    monkeypatch.setenv(ENV_PROVIDER_TYPE, exa_provider_name(provider_type))
-
-
-def _set_auth_param(monkeypatch: MonkeyPatch, name: str, value: str):
-    monkeypatch.setenv(exa_parameter_env_name(AuthParameter(name)), value)
+def _auth_env(
+    provider_type: type[AuthProvider] | None = None, **params: str
+) -> dict[str, str]:
+    """
+    Builds the environment variables that configure the MCP server authentication.
+    """
+    env = {
+        exa_parameter_env_name(AuthParameter(name)): value
+        for name, value in params.items()
+    }
+    if provider_type is not None:
+        env[ENV_PROVIDER_TYPE] = exa_provider_name(provider_type)
+    return env
 
 
-def _mcp_server_factory(env: dict[str, str], monkeypatch: MonkeyPatch | None = None):
+def _create_mcp_server(
+    env: dict[str, str], auth_env: dict[str, str], base_url: str | None
+) -> FastMCP:
     """
-    Returns an MCP server factory that creates the MCP server and runs it as an http
-    server at the provided host and port.
-    The factory also adds one more tool - say_hello - for testing the MCP OpenID
-    infrastructure without the database.
+    Creates the MCP server with the provided connection and authentication settings.
+    The authentication environment is applied only while the auth provider is being
+    created, so that servers with different authentication settings can run side by
+    side. The function also adds one more tool - say_hello - for testing the MCP
+    OpenID infrastructure without the database.
     """
 
     def say_hello() -> str:
@@ -443,42 +571,59 @@ def _mcp_server_factory(env: dict[str, str], monkeypatch: MonkeyPatch | None = N
         _, token = get_oidc_user(None)
         return token
 
-    def run_server(host: str, port: int) -> None:
-
-        if monkeypatch is not None:
-            _set_auth_param(monkeypatch, "base_url", f"http://{host}:{port}")
+    with MonkeyPatch.context() as mp:
+        for name, value in auth_env.items():
+            mp.setenv(name, value)
+        if base_url:
+            mp.setenv(exa_parameter_env_name(AuthParameter("base_url")), base_url)
         auth = get_auth_provider()
-        connection_factory = get_connection_factory(
-            env,
-            websocket_sslopt={"cert_reqs": ssl.CERT_NONE},
-        )
-        connection = DbConnection(connection_factory=connection_factory)
-
-        mcp_server = create_mcp_server(
-            connection=connection,
-            config=McpServerSettings(schemas=MetaListSettings(enable=True)),
-            auth=auth,
-        )
-        mcp_server.tool(say_hello, description="The tool just says Hello")
-        mcp_server.tool(
-            get_access_token_string, description="The tool returns the access token"
-        )
-        mcp_server.run(transport="http", host=host, port=port)
+    connection_factory = get_connection_factory(
+        env,
+        websocket_sslopt={"cert_reqs": ssl.CERT_NONE},
+    )
+    connection = DbConnection(connection_factory=connection_factory)
 
-    return run_server
+    mcp_server = create_mcp_server(
+        connection=connection,
+        config=McpServerSettings(schemas=MetaListSettings(enable=True)),
+        auth=auth,
+    )
+    mcp_server.tool(say_hello, description="The tool just says Hello")
+    mcp_server.tool(
+        get_access_token_string, description="The tool returns the access token"
+    )
+    return mcp_server
 
 
-def _start_mcp_server(
-    env: dict[str, str], monkeypatch: MonkeyPatch | None = None
-) -> Generator[None, None, str]:
+@pytest.fixture(scope="session")
+def mcp_server_pool() -> Generator[Callable[..., str], None, None]:
     """
-    Starts the MCP server in a separate process and returns its url.
+    The fixture returns a function that starts the server for a given combination of
+    the connection and authentication settings, or returns the url of the one already
+    started with the same settings. The servers run in background threads of the test
+    process, which saves starting a new process for each of them. All started servers
+    keep running until the end of the session.
     """
-    with run_server_in_process(_mcp_server_factory(env, monkeypatch)) as url:
-        yield f"{url}/mcp"
+    servers: dict[tuple[frozenset, frozenset], str] = {}
+
+    with ExitStack() as stack:
+
+        def get_server(
+            env: dict[str, str], auth_env: dict[str, str], set_base_url: bool = True
+        ) -> str:
+            key = (frozenset(env.items()), frozenset(auth_env.items()))
+            if key not in servers:
+                host, port = "127.0.0.1", find_available_port()
+                base_url = f"http://{host}:{port}" if set_base_url else None
+                mcp_server = _create_mcp_server(env, auth_env, base_url)
+                url = stack.enter_context(run_server_in_thread(mcp_server, host, port))
+                servers[key] = f"{url}/mcp"
+            return servers[key]
 
+        yield get_server
 
-@pytest.fixture(params=["A", "B", "C"])
+
+@pytest.fixture(scope="session", params=["A", "B", "C"])
 def oidc_env(
     request, run_on_itde, backend_aware_onprem_database_params
 ) -> dict[str, str]:
@@ -487,6 +632,12 @@ def oidc_env(
     backend. It provides 3 configuration options - A, B and C - as described in the
     `get_connection_factory` docstring. Please refer to this documentation for more
     details on various connection options.
+
+    The connection option doesn't depend on the way the MCP server obtains the access
+    token. Tests can narrow down the options using indirect parametrization. The tests
+    that don't use the DB run with the option A only. The remote OAuth tests cover all
+    three options, while other auth providers are tested with the option B, where the
+    access token is passed all the way to the database.
     """
     env = {ENV_DSN: backend_aware_onprem_database_params["dsn"]}
     if request.param in ["A", "C"]:
@@ -497,18 +648,7 @@ def oidc_env(
     return env
 
 
-@pytest.fixture
-def oidc_env_run_once(oidc_env) -> None:
-    """
-    The `oidc env` fixture sets different options for DB connection.
-    For the tests that do not use DB this is irrelevant. We don't want
-    these test to run multiple times unnecessarily.
-    """
-    if ENV_USERNAME_CLAIM in oidc_env:
-        pytest.skip("Same test already ran")
-
-
-@pytest.fixture(params=["D", "E"])
+@pytest.fixture(scope="session", params=["D", "E"])
 def saas_env(
     request,
     run_on_saas,
@@ -534,24 +674,27 @@ def saas_env(
     return env
 
 
-@pytest.fixture
-def mcp_server_with_remote_oauth(oidc_server, oidc_env, monkeypatch):
+@pytest.fixture(scope="session")
+def mcp_server_with_remote_oauth(mcp_server_pool, oidc_server, oidc_env) -> str:
     """
     Starts the MCP server using an external identity provider that supports DCR.
     https://gofastmcp.com/servers/auth/remote-oauth
     """
-    _set_auth_type(monkeypatch, RemoteAuthProvider)
-    _set_auth_param(monkeypatch, "jwks_uri", f"{oidc_server}/jwks")
-    _set_auth_param(monkeypatch, "authorization_servers", oidc_server)
-    _set_auth_param(monkeypatch, "scopes_supported", AUTH_SCOPE)
-
-    for url in _start_mcp_server(oidc_env, monkeypatch):
-        print(f"✓ MCP server with Remote OAuth started at {url}")
-        yield url
+    auth_env = _auth_env(
+        RemoteAuthProvider,
+        jwks_uri=f"{oidc_server}/jwks",
+        authorization_servers=oidc_server,
+        scopes_supported=AUTH_SCOPE,
+    )
+    url = mcp_server_pool(oidc_env, auth_env)
+    print(f"✓ MCP server with Remote OAuth started at {url}")
+    return url
 
 
-@pytest.fixture
-def mcp_server_with_oauth_proxy(started_manually, oidc_server, oidc_env, monkeypatch):
+@pytest.fixture(scope="session")
+def mcp_server_with_oauth_proxy(
+    mcp_server_pool, started_manually, oidc_server, oidc_env
+) -> str:
     """
     Starts the MCP server using an external identity provider that doesn't support DCR.
     https://gofastmcp.com/servers/auth/oauth-proxy
@@ -562,48 +705,43 @@ def mcp_server_with_oauth_proxy(started_manually, oidc_server, oidc_env, monkeyp
     if not started_manually:
         pytest.skip("OAuth Proxy tests can only be run manually")
 
-    _set_auth_type(monkeypatch, OAuthProxy)
-    _set_auth_param(monkeypatch, "jwks_uri", f"{oidc_server}/jwks")
-    _set_auth_param(
-        monkeypatch,
-        "upstream_authorization_endpoint",
-        f"{oidc_server}/oauth2/authorize",
-    )
-    _set_auth_param(
-        monkeypatch, "upstream_token_endpoint", f"{oidc_server}/oauth2/token"
+    auth_env = _auth_env(
+        OAuthProxy,
+        jwks_uri=f"{oidc_server}/jwks",
+        upstream_authorization_endpoint=f"{oidc_server}/oauth2/authorize",
+        upstream_token_endpoint=f"{oidc_server}/oauth2/token",
+        upstream_client_id="MY_CLIENT_ID",
+        upstream_client_secret="MY_CLIENT_SECRET",
     )
-    _set_auth_param(monkeypatch, "upstream_client_id", "MY_CLIENT_ID")
-    _set_auth_param(monkeypatch, "upstream_client_secret", "MY_CLIENT_SECRET")
-
-    for url in _start_mcp_server(oidc_env, monkeypatch):
-        print(f"✓ MCP server with OAuth Proxy started at {url}")
-        yield url
+    url = mcp_server_pool(oidc_env, auth_env)
+    print(f"✓ MCP server with OAuth Proxy started at {url}")
+    return url
 
 
-@pytest.fixture
-def mcp_server_with_token_verifier(oidc_server, oidc_env, monkeypatch):
+@pytest.fixture(scope="session")
+def mcp_server_with_token_verifier(mcp_server_pool, oidc_server, oidc_env) -> str:
     """
     Starts the MCP server that only verifies externally provided tokens
     https://gofastmcp.com/servers/auth/token-verification
     """
-    _set_auth_type(monkeypatch, JWTVerifier)
-    _set_auth_param(monkeypatch, "jwks_uri", f"{oidc_server}/jwks")
-    for url in _start_mcp_server(oidc_env):
-        print(f"✓ MCP server with Token Verification started at {url}")
-        yield url
+    auth_env = _auth_env(JWTVerifier, jwks_uri=f"{oidc_server}/jwks")
+    url = mcp_server_pool(oidc_env, auth_env, set_base_url=False)
+    print(f"✓ MCP server with Token Verification started at {url}")
+    return url
 
 
-@pytest.fixture
-def mcp_server_with_saas(saas_env, monkeypatch):
+@pytest.fixture(scope="session")
+def mcp_server_with_saas(mcp_server_pool, saas_env) -> str:
     """
     Starts the MCP server with no authorization.
     """
-    for url in _start_mcp_server(saas_env, monkeypatch):
-        print(f"✓ MCP server with No OAuth started at {url}")
-        yield url
+    url = mcp_server_pool(saas_env, _auth_env())
+    print(f"✓ MCP server with No OAuth started at {url}")
+    return url
 
 
 async def _run_tool_async(
+    http_client: httpx.Client,
     http_server_url: str,
     tool_name: str,
     auto_auth: bool = True,
@@ -617,37 +755,52 @@ async def _run_tool_async(
     b. None, if the headers are provided (SaaS case),
     c. authomatic authorization, if `auto_auth` is True,
     d. UI based authorization, otherwise (for manual tests).
-    Then calls the specified tool asynchronously.
+    Then calls the specified tool asynchronously. The `http_client` is used by the
+    automatic authorization.
     """
     if token:
         oauth = token
     elif headers:
         oauth = None
     elif auto_auth:
-        oauth = OAuthHeadless(mcp_url=http_server_url, scopes=AUTH_SCOPE)
+        oauth = OAuthHeadless(
+            mcp_url=http_server_url, scopes=AUTH_SCOPE, http_client=http_client
+        )
     else:
         oauth = OAuth(mcp_url=http_server_url, scopes=AUTH_SCOPE)
-    async with Client(
-        transport=StreamableHttpTransport(http_server_url, headers=headers), auth=oauth
-    ) as client:
-        assert await client.ping()
-        result = await client.call_tool(tool_name, kwargs)
-        return result.content[0].text
+    try:
+        async with Client(
+            transport=StreamableHttpTransport(http_server_url, headers=headers),
+            auth=oauth,
+        ) as client:
+            result = await client.call_tool(tool_name, kwargs)
+    finally:
+        if isinstance(oauth, OAuthHeadless):
+            oauth.join_pending_auth_threads()
+    return result.content[0].text
 
 
 def _run_say_hello_test(
-    http_server_url: str, auto_auth: bool = True, token: str | None = None
+    runner: asyncio.Runner,
+    http_client: httpx.Client,
+    http_server_url: str,
+    auto_auth: bool = True,
+    token: str | None = None,
 ) -> None:
     """
     Tests the added test tool that doesn't require the database.
     """
-    result_text = asyncio.run(
-        _run_tool_async(http_server_url, "say_hello", auto_auth=auto_auth, token=token)
+    result_text = runner.run(
+        _run_tool_async(
+            http_client, http_server_url, "say_hello", auto_auth=auto_auth, token=token
+        )
     )
     assert result_text == f"Hello {OIDC_USER_NAME}"
 
 
 def _run_list_schemas_test(
+    runner: asyncio.Runner,
+    http_client: httpx.Client,
     http_server_url: str,
     db_schemas: list[ExaSchema],
     auto_auth: bool = True,
@@ -657,8 +810,9 @@ def _run_list_schemas_test(
     """
     Tests one of the real tools that requires the database.
     """
-    result_text = asyncio.run(
+    result_text = runner.run(
         _run_tool_async(
+            http_client,
             http_server_url,
             "list_exasol_schemas",
             token=token,
@@ -672,53 +826,98 @@ def _run_list_schemas_test(
     assert schemas == expected_schemas
 
 
-@pytest.fixture
-def bearer_token(mcp_server_with_remote_oauth) -> str:
+@pytest.fixture(scope="session")
+def http_client() -> Generator[httpx.Client, None, None]:
+    """
+    The HTTP client used for the headless authorization, with a pool of connections.
+    """
+    with httpx.Client(
+        timeout=5.0, limits=httpx.Limits(max_keepalive_connections=8)
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def bearer_token(event_loop_runner, http_client, mcp_server_with_remote_oauth) -> str:
     """
     This feature creates an access token for the bearer token mode testing,
-    using another MCP server.
+    using another MCP server. The token is shared by the tests for the session.
+    It is valid for an hour, which is the default token lifetime of the mock
+    authorization server, and is much longer than the test session.
     """
-    return asyncio.run(
-        _run_tool_async(mcp_server_with_remote_oauth, "get_access_token_string")
+    return event_loop_runner.run(
+        _run_tool_async(
+            http_client, mcp_server_with_remote_oauth, "get_access_token_string"
+        )
     )
 
 
-def test_remote_oauth_no_db(oidc_env_run_once, mcp_server_with_remote_oauth) -> None:
-    _run_say_hello_test(mcp_server_with_remote_oauth)
+@pytest.mark.parametrize("oidc_env", ["A"], indirect=True)
+def test_remote_oauth_no_db(
+    event_loop_runner, http_client, mcp_server_with_remote_oauth
+) -> None:
+    _run_say_hello_test(event_loop_runner, http_client, mcp_server_with_remote_oauth)
 
 
-def test_oauth_proxy_no_db(oidc_env_run_once, mcp_server_with_oauth_proxy) -> None:
-    _run_say_hello_test(mcp_server_with_oauth_proxy, auto_auth=False)
+@pytest.mark.parametrize("oidc_env", ["A"], indirect=True)
+def test_oauth_proxy_no_db(
+    event_loop_runner, http_client, mcp_server_with_oauth_proxy
+) -> None:
+    _run_say_hello_test(
+        event_loop_runner, http_client, mcp_server_with_oauth_proxy, auto_auth=False
+    )
 
 
+@pytest.mark.parametrize("oidc_env", ["A"], indirect=True)
 def test_bearer_token_no_db(
-    oidc_env_run_once, bearer_token, mcp_server_with_token_verifier
+    event_loop_runner, http_client, bearer_token, mcp_server_with_token_verifier
 ) -> None:
-    _run_say_hello_test(mcp_server_with_token_verifier, token=bearer_token)
+    _run_say_hello_test(
+        event_loop_runner,
+        http_client,
+        mcp_server_with_token_verifier,
+        token=bearer_token,
+    )
 
 
 def test_remote_oauth_with_itde(
     create_users,
+    event_loop_runner,
+    http_client,
     mcp_server_with_remote_oauth,
     setup_docker_network,
     setup_database,
     db_schemas,
 ) -> None:
-    _run_list_schemas_test(mcp_server_with_remote_oauth, db_schemas)
+    _run_list_schemas_test(
+        event_loop_runner, http_client, mcp_server_with_remote_oauth, db_schemas
+    )
 
 
+@pytest.mark.parametrize("oidc_env", ["B"], indirect=True)
 def test_oauth_proxy_with_itde(
     create_users,
+    event_loop_runner,
+    http_client,
     mcp_server_with_oauth_proxy,
     setup_docker_network,
     setup_database,
     db_schemas,
 ) -> None:
-    _run_list_schemas_test(mcp_server_with_oauth_proxy, db_schemas, auto_auth=False)
+    _run_list_schemas_test(
+        event_loop_runner,
+        http_client,
+        mcp_server_with_oauth_proxy,
+        db_schemas,
+        auto_auth=False,
+    )
 
 
+@pytest.mark.parametrize("oidc_env", ["B"], indirect=True)
 def test_bearer_token_with_itde(
     create_users,
+    event_loop_runner,
+    http_client,
     bearer_token,
     mcp_server_with_token_verifier,
     setup_docker_network,
@@ -726,13 +925,26 @@ def test_bearer_token_with_itde(
     db_schemas,
 ) -> None:
     _run_list_schemas_test(
-        mcp_server_with_token_verifier, db_schemas, token=bearer_token
+        event_loop_runner,
+        http_client,
+        mcp_server_with_token_verifier,
+        db_schemas,
+        token=bearer_token,
     )
 
 
 def test_remote_oauth_with_saas(
-    mcp_server_with_saas, setup_database, db_schemas, saas_pat
+    event_loop_runner,
+    http_client,
+    mcp_server_with_saas,
+    setup_database,
+    db_schemas,
+    saas_pat,
 ) -> None:
     _run_list_schemas_test(
-        mcp_server_with_saas, db_schemas, headers={PAT_HEADER: saas_pat}
+        event_loop_runner,
+        http_client,
+        mcp_server_with_saas,
+        db_schemas,
+        headers={PAT_HEADER: saas_pat},
     )
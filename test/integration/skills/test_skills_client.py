@@ -21,8 +21,13 @@ EXPECTED_SKILL_URIS = {
 }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_server():
+    """
+    The skills don't depend on the database, so all tests in this module share the
+    same MCP server.
+    """
+
     @contextmanager
     def connection_factory(
         no_auth: bool = False,
@@ -39,47 +44,50 @@ async def _list_resource_uris(server) -> set[str]:
         return {str(r.uri) for r in resources}
 
 
-async def _read_resource(server, uri: str) -> str:
+async def _read_resources(server, uris: list[str]) -> dict[str, str]:
     async with Client(server) as client:
-        contents = await client.read_resource(uri)
-        return contents[0].text
+        contents = await asyncio.gather(*(client.read_resource(uri) for uri in uris))
+        return {uri: content[0].text for uri, content in zip(uris, contents)}
+
+
+@pytest.fixture(scope="module")
+def skill_contents(event_loop_runner, mcp_server) -> dict[str, str]:
+    """
+    Reads all expected skills concurrently, in one go, and returns their content
+    per URI.
+    """
+    uris = sorted(EXPECTED_SKILL_URIS)
+    return event_loop_runner.run(_read_resources(mcp_server, uris))
 
 
-def test_skills_are_listed(mcp_server):
-    uris = asyncio.run(_list_resource_uris(mcp_server))
+def test_skills_are_listed(event_loop_runner, mcp_server):
+    uris = event_loop_runner.run(_list_resource_uris(mcp_server))
     assert EXPECTED_SKILL_URIS.issubset(uris)
 
 
 @pytest.mark.parametrize("uri", sorted(EXPECTED_SKILL_URIS))
-def test_skill_content_is_readable(mcp_server, uri):
-    content = asyncio.run(_read_resource(mcp_server, uri))
-    assert len(content) > 0
+def test_skill_content_is_readable(skill_contents, uri):
+    assert len(skill_contents[uri]) > 0
 
 
-def test_sql_dialect_skill_mentions_fetch_first(mcp_server):
-    content = asyncio.run(
-        _read_resource(mcp_server, "skill://exasol-sql-dialect/SKILL.md")
-    )
+def test_sql_dialect_skill_mentions_fetch_first(skill_contents):
+    content = skill_contents["skill://exasol-sql-dialect/SKILL.md"]
     assert "FETCH FIRST" in content
 
 
-def test_udfs_skill_mentions_exaiterator(mcp_server):
-    content = asyncio.run(_read_resource(mcp_server, "skill://exasol-udfs/SKILL.md"))
+def test_udfs_skill_mentions_exaiterator(skill_contents):
+    content = skill_contents["skill://exasol-udfs/SKILL.md"]
     assert "ExaIterator" in content
 
 
-def test_system_tables_skill_mentions_exa_all(mcp_server):
-    content = asyncio.run(
-        _read_resource(mcp_server, "skill://exasol-system-tables/SKILL.md")
-    )
+def test_system_tables_skill_mentions_exa_all(skill_contents):
+    content = skill_contents["skill://exasol-system-tables/SKILL.md"]
     assert "EXA_ALL_" in content
     assert "EXA_ALL_OBJECT_SIZES" in content
     assert "EXA_DBA_INDICES" in content
     assert "EXA_SQL_LAST_DAY" in content
 
 
-def test_mcp_server_skill_mentions_workflows(mcp_server):
-    content = asyncio.run(
-        _read_resource(mcp_server, "skill://exasol-mcp-server/SKILL.md")
-    )
+def test_mcp_server_skill_mentions_workflows(skill_contents):
+    content = skill_contents["skill://exasol-mcp-server/SKILL.md"]
     assert "Workflows" in content
@@ -1,10 +1,12 @@
 import asyncio
 from collections.abc import (
     ByteString,
+    Callable,
     Generator,
 )
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import partial
 from test.utils.db_objects import (
     ExaBfsDir,
     ExaBfsFile,
@@ -17,6 +19,8 @@ from test.utils.result_utils import (
     get_tool_hints,
     list_tools,
 )
+from test.utils.tool_utils import connect_client
+from typing import Any
 from unittest.mock import (
     create_autospec,
     patch,
@@ -25,7 +29,6 @@ from unittest.mock import (
 import exasol.bucketfs as bfs
 import pyexasol
 import pytest
-from fastmcp import Client
 from fastmcp.client.elicitation import ElicitResult
 from fastmcp.exceptions import ToolError
 from tenacity import retry
@@ -104,12 +107,14 @@ class ModifyTestCase:
         return self._expected_value(self.content, "file_content")
 
 
-async def _run_tool_async(
+def _run_tool_in_loop(
     bucketfs_location: bfs.path.PathLike,
     tool_name: str,
-    elicitation: list[ElicitationData] | None,
-    expected_status: PathStatus | None,
-    config: McpServerSettings | None,
+    elicitation: list[ElicitationData] | None = None,
+    expected_status: PathStatus | None = None,
+    config: McpServerSettings | None = None,
+    *,
+    runner: asyncio.Runner,
     **kwargs,
 ):
     elicit_count = 0
@@ -141,23 +146,8 @@ async def _run_tool_async(
         )
     exa_server = create_mcp_server(db_connection, config, bucketfs_location)
     elicit_handler = elicitation_handler if elicitation is not None else None
-    async with Client(exa_server, elicitation_handler=elicit_handler) as client:
-        return await client.call_tool(tool_name, kwargs)
-
-
-def _run_tool(
-    bucketfs_location: bfs.path.PathLike,
-    tool_name: str,
-    elicitation: list[ElicitationData] | None = None,
-    expected_status: PathStatus | None = None,
-    config: McpServerSettings | None = None,
-    **kwargs,
-):
-    return asyncio.run(
-        _run_tool_async(
-            bucketfs_location, tool_name, elicitation, expected_status, config, **kwargs
-        )
-    )
+    with connect_client(exa_server, runner, elicit_handler) as client:
+        return runner.run(client.call_tool(tool_name, kwargs))
 
 
 def _get_expected_list(items: dict[str, ExaBfsObject]) -> list[str]:
@@ -227,6 +217,14 @@ def no_elicit_config() -> McpServerSettings:
     return McpServerSettings(enable_write_bucketfs=True, disable_elicitation=True)
 
 
+@pytest.fixture(scope="module")
+def run_bucketfs_tool(event_loop_runner) -> Callable[..., Any]:
+    """
+    Provides the `_run_tool_in_loop` helper bound to the session event loop.
+    """
+    return partial(_run_tool_in_loop, runner=event_loop_runner)
+
+
 @pytest.mark.parametrize("enable_bucketfs", [False, True])
 @patch("exasol.ai.mcp.server.main.get_mcp_settings")
 @patch("exasol.ai.mcp.server.connection.connection_factory.get_connection_factory")
@@ -255,11 +253,11 @@ def test_mcp_server_with_bucketfs(
     assert (server.bucketfs_tools is not None) == enable_bucketfs
 
 
-def test_list_directories(bucketfs_location, bfs_data) -> None:
+def test_list_directories(bucketfs_location, bfs_data, run_bucketfs_tool) -> None:
     for item in bfs_data.items:
         if isinstance(item, ExaBfsDir):
             path = f"{bfs_data.name}/{item.name}"
-            result = _run_tool(
+            result = run_bucketfs_tool(
                 bucketfs_location, "list_bucketfs_directories", directory=path
             )
             result_json = sorted(get_result_json(result))
@@ -272,19 +270,21 @@ def test_list_directories(bucketfs_location, bfs_data) -> None:
             assert result_json == expected_json
 
 
-def test_list_directories_root(bucketfs_location, bfs_data) -> None:
-    result = _run_tool(bucketfs_location, "list_bucketfs_directories")
+def test_list_directories_root(bucketfs_location, bfs_data, run_bucketfs_tool) -> None:
+    result = run_bucketfs_tool(bucketfs_location, "list_bucketfs_directories")
     result_json = sorted(get_result_json(result))
     expected_nodes = {bfs_data.name: bfs_data}
     expected_json = _get_expected_list(expected_nodes)
     assert result_json == expected_json
 
 
-def test_list_files(bucketfs_location, bfs_data) -> None:
+def test_list_files(bucketfs_location, bfs_data, run_bucketfs_tool) -> None:
     for item in bfs_data.items:
         if isinstance(item, ExaBfsDir):
             path = f"{bfs_data.name}/{item.name}"
-            result = _run_tool(bucketfs_location, "list_bucketfs_files", directory=path)
+            result = run_bucketfs_tool(
+                bucketfs_location, "list_bucketfs_files", directory=path
+            )
             result_json = sorted(get_result_json(result)) if result.content else []
             expected_nodes = {
                 f"{path}/{sub_item.name}": sub_item
@@ -295,35 +295,39 @@ def test_list_files(bucketfs_location, bfs_data) -> None:
             assert result_json == expected_json
 
 
-def test_list_files_root(bucketfs_location) -> None:
-    result = _run_tool(bucketfs_location, "list_bucketfs_files")
+def test_list_files_root(bucketfs_location, run_bucketfs_tool) -> None:
+    result = run_bucketfs_tool(bucketfs_location, "list_bucketfs_files")
     assert not result.content
 
 
-def test_list_not_in_directory(bucketfs_location, bfs_data) -> None:
+def test_list_not_in_directory(bucketfs_location, bfs_data, run_bucketfs_tool) -> None:
     for item in bfs_data.items:
         if isinstance(item, ExaBfsFile):
             path = f"{bfs_data.name}/{item.name}"
             with pytest.raises(ToolError):
-                _run_tool(
+                run_bucketfs_tool(
                     bucketfs_location, "list_bucketfs_directories", directory=path
                 )
             with pytest.raises(ToolError):
-                _run_tool(bucketfs_location, "list_bucketfs_files", directory=path)
+                run_bucketfs_tool(
+                    bucketfs_location, "list_bucketfs_files", directory=path
+                )
 
 
-def test_list_in_nowhere(bucketfs_location, bfs_data) -> None:
+def test_list_in_nowhere(bucketfs_location, bfs_data, run_bucketfs_tool) -> None:
     path = f"{bfs_data.name}/Unicorn"
     with pytest.raises(ToolError):
-        _run_tool(bucketfs_location, "list_bucketfs_directories", directory=path)
+        run_bucketfs_tool(
+            bucketfs_location, "list_bucketfs_directories", directory=path
+        )
     with pytest.raises(ToolError):
-        _run_tool(bucketfs_location, "list_bucketfs_files", directory=path)
+        run_bucketfs_tool(bucketfs_location, "list_bucketfs_files", directory=path)
 
 
 @pytest.mark.parametrize("path", ["Species/Carnivores", "Species", ""])
-def test_find_files(bucketfs_location, bfs_data, path) -> None:
+def test_find_files(bucketfs_location, bfs_data, path, run_bucketfs_tool) -> None:
     keywords = ["cat"]
-    result = _run_tool(
+    result = run_bucketfs_tool(
         bucketfs_location, "find_bucketfs_files", keywords=keywords, directory=path
     )
     result_json = sorted(get_result_json(result))
@@ -332,11 +336,13 @@ def test_find_files(bucketfs_location, bfs_data, path) -> None:
     assert result_json == expected_json
 
 
-def test_read_file(bucketfs_location, bfs_data) -> None:
+def test_read_file(bucketfs_location, bfs_data, run_bucketfs_tool) -> None:
     file_path = "Species/Rodents/Squirrel/Eastern_Gray_Squirrel"
     item = next(iter(bfs_data.find_descendants(["Eastern_Gray_Squirrel"]).values()))
     assert isinstance(item, ExaBfsFile)
-    result = _run_tool(bucketfs_location, "read_bucketfs_text_file", path=file_path)
+    result = run_bucketfs_tool(
+        bucketfs_location, "read_bucketfs_text_file", path=file_path
+    )
     content = get_result_content(result)
     assert content == str(item.content, encoding="utf-8")
 
@@ -431,16 +437,16 @@ def test_read_file(bucketfs_location, bfs_data) -> None:
         "directory",
     ],
 )
-def test_write_text_to_file(bucketfs_location, test_case) -> None:
+def test_write_text_to_file(bucketfs_location, test_case, run_bucketfs_tool) -> None:
     with tmp_path_write(bucketfs_location.joinpath(test_case.expected_path)):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "write_text_to_bucketfs_file",
             elicitation=test_case.elicitations,
             path=test_case.path,
             content=test_case.content,
         )
-        result = _run_tool(
+        result = run_bucketfs_tool(
             bucketfs_location, "read_bucketfs_text_file", path=test_case.expected_path
         )
         content = get_result_content(result)
@@ -448,7 +454,9 @@ def test_write_text_to_file(bucketfs_location, test_case) -> None:
 
 
 @pytest.mark.parametrize("action", ["decline", "cancel", None])
-def test_write_text_to_file_not_accepted(bucketfs_location, action) -> None:
+def test_write_text_to_file_not_accepted(
+    bucketfs_location, action, run_bucketfs_tool
+) -> None:
     """
     Verifies the case when the file writing is rejected in elicitation.
     """
@@ -457,7 +465,7 @@ def test_write_text_to_file_not_accepted(bucketfs_location, action) -> None:
         ElicitationData(path_status=PathStatus.Vacant, action=action, data={}),
     ]
     with pytest.raises(ToolError):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "write_text_to_bucketfs_file",
             elicitation=elicitation,
@@ -544,18 +552,20 @@ def test_write_text_to_file_not_accepted(bucketfs_location, action) -> None:
         "directory",
     ],
 )
-def test_download_file(bucketfs_location, test_case, httpserver) -> None:
+def test_download_file(
+    bucketfs_location, test_case, httpserver, run_bucketfs_tool
+) -> None:
     url_path = "/fake_science"
     httpserver.expect_request(url_path).respond_with_data(_home_luminis)
     with tmp_path_write(bucketfs_location.joinpath(test_case.expected_path)):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "download_file",
             elicitation=test_case.elicitations,
             url=httpserver.url_for(url_path),
             path=test_case.path,
         )
-        result = _run_tool(
+        result = run_bucketfs_tool(
             bucketfs_location, "read_bucketfs_text_file", path=test_case.expected_path
         )
         content = get_result_content(result)
@@ -563,7 +573,9 @@ def test_download_file(bucketfs_location, test_case, httpserver) -> None:
 
 
 @pytest.mark.parametrize("action", ["decline", "cancel", None])
-def test_download_file_not_accepted(bucketfs_location, action, httpserver) -> None:
+def test_download_file_not_accepted(
+    bucketfs_location, action, httpserver, run_bucketfs_tool
+) -> None:
     """
     Verifies the case when the file downloading is rejected in elicitation.
     """
@@ -574,7 +586,7 @@ def test_download_file_not_accepted(bucketfs_location, action, httpserver) -> No
         ElicitationData(path_status=PathStatus.Vacant, action=action, data={}),
     ]
     with pytest.raises(ToolError):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "download_file",
             elicitation=elicitation,
@@ -585,7 +597,9 @@ def test_download_file_not_accepted(bucketfs_location, action, httpserver) -> No
     assert not bfs_path.exists()
 
 
-def test_download_file_invalid_url(bucketfs_location, httpserver) -> None:
+def test_download_file_invalid_url(
+    bucketfs_location, httpserver, run_bucketfs_tool
+) -> None:
     """
     Verifies the case when the provided url doesn't exist.
     """
@@ -596,7 +610,7 @@ def test_download_file_invalid_url(bucketfs_location, httpserver) -> None:
         ElicitationData(path_status=PathStatus.Vacant, action="accept", data={}),
     ]
     with pytest.raises(ToolError):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "download_file",
             elicitation=elicitation,
@@ -672,11 +686,11 @@ def test_download_file_invalid_url(bucketfs_location, httpserver) -> None:
         "directory",
     ],
 )
-def test_delete_file(bucketfs_location, test_case) -> None:
+def test_delete_file(bucketfs_location, test_case, run_bucketfs_tool) -> None:
     abs_path = bucketfs_location.joinpath(test_case.expected_path)
     assert abs_path.exists()
     with tmp_path_write(abs_path):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "delete_bucketfs_file",
             elicitation=test_case.elicitations,
@@ -687,7 +701,7 @@ def test_delete_file(bucketfs_location, test_case) -> None:
 
 
 @pytest.mark.parametrize("action", ["decline", "cancel", None])
-def test_delete_file_not_accepted(bucketfs_location, action) -> None:
+def test_delete_file_not_accepted(bucketfs_location, action, run_bucketfs_tool) -> None:
     """
     Verifies the case when the file deletion is rejected in elicitation.
     """
@@ -696,7 +710,7 @@ def test_delete_file_not_accepted(bucketfs_location, action) -> None:
         ElicitationData(path_status=PathStatus.FileExists, action=action, data={}),
     ]
     with pytest.raises(ToolError):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "delete_bucketfs_file",
             elicitation=elicitation,
@@ -770,11 +784,11 @@ def test_delete_file_not_accepted(bucketfs_location, action) -> None:
         "file",
     ],
 )
-def test_delete_directory(bucketfs_location, test_case) -> None:
+def test_delete_directory(bucketfs_location, test_case, run_bucketfs_tool) -> None:
     abs_path = bucketfs_location.joinpath(test_case.expected_path)
     assert abs_path.exists()
     with tmp_path_write(abs_path):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "delete_bucketfs_directory",
             elicitation=test_case.elicitations,
@@ -785,7 +799,9 @@ def test_delete_directory(bucketfs_location, test_case) -> None:
 
 
 @pytest.mark.parametrize("action", ["decline", "cancel", None])
-def test_delete_directory_not_accepted(bucketfs_location, action) -> None:
+def test_delete_directory_not_accepted(
+    bucketfs_location, action, run_bucketfs_tool
+) -> None:
     """
     Verifies the case when the directory deletion is rejected in elicitation.
     """
@@ -794,7 +810,7 @@ def test_delete_directory_not_accepted(bucketfs_location, action) -> None:
         ElicitationData(path_status=PathStatus.DirExists, action=action, data={}),
     ]
     with pytest.raises(ToolError):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "delete_bucketfs_directory",
             elicitation=elicitation,
@@ -804,46 +820,54 @@ def test_delete_directory_not_accepted(bucketfs_location, action) -> None:
     assert bfs_path.exists()
 
 
-def test_write_file_no_elicitation(bucketfs_location, no_elicit_config) -> None:
+def test_write_file_no_elicitation(
+    bucketfs_location, no_elicit_config, run_bucketfs_tool
+) -> None:
     path = "No_elicitation/new_created_file"
     with tmp_path_write(bucketfs_location.joinpath(path)):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "write_text_to_bucketfs_file",
             config=no_elicit_config,
             path=path,
             content=_human,
         )
-        result = _run_tool(bucketfs_location, "read_bucketfs_text_file", path=path)
+        result = run_bucketfs_tool(
+            bucketfs_location, "read_bucketfs_text_file", path=path
+        )
         content = get_result_content(result)
         assert content == _human
 
 
 def test_download_file_no_elicitation(
-    bucketfs_location, httpserver, no_elicit_config
+    bucketfs_location, httpserver, no_elicit_config, run_bucketfs_tool
 ) -> None:
     path = "No_elicitation/new_downloaded_file"
     url = "/fake_science"
     httpserver.expect_request(url).respond_with_data(_human)
     with tmp_path_write(bucketfs_location.joinpath(path)):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "download_file",
             config=no_elicit_config,
             url=httpserver.url_for(url),
             path=path,
         )
-        result = _run_tool(bucketfs_location, "read_bucketfs_text_file", path=path)
+        result = run_bucketfs_tool(
+            bucketfs_location, "read_bucketfs_text_file", path=path
+        )
         content = get_result_content(result)
         assert content == _human
 
 
-def test_delete_file_no_elicitation(bucketfs_location, no_elicit_config) -> None:
+def test_delete_file_no_elicitation(
+    bucketfs_location, no_elicit_config, run_bucketfs_tool
+) -> None:
     path = "Species/Even-toed_Ungulates/Deer/Elk"
     abs_path = bucketfs_location.joinpath(path)
     assert abs_path.exists()
     with tmp_path_write(abs_path):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "delete_bucketfs_file",
             config=no_elicit_config,
@@ -852,12 +876,14 @@ def test_delete_file_no_elicitation(bucketfs_location, no_elicit_config) -> None
         assert not abs_path.exists()
 
 
-def test_delete_directory_no_elicitation(bucketfs_location, no_elicit_config) -> None:
+def test_delete_directory_no_elicitation(
+    bucketfs_location, no_elicit_config, run_bucketfs_tool
+) -> None:
     path = "Species/Carnivores/Dog"
     abs_path = bucketfs_location.joinpath(path)
     assert abs_path.exists()
     with tmp_path_write(abs_path):
-        _run_tool(
+        run_bucketfs_tool(
             bucketfs_location,
             "delete_bucketfs_directory",
             config=no_elicit_config,
@@ -866,12 +892,16 @@ def test_delete_directory_no_elicitation(bucketfs_location, no_elicit_config) ->
         assert not abs_path.exists()
 
 
-def test_bucketfs_tool_hints(pyexasol_connection, bucketfs_location) -> None:
+def test_bucketfs_tool_hints(
+    pyexasol_connection, bucketfs_location, event_loop_runner
+) -> None:
     """
     This test validates hints the tool annotations.
     """
     config = McpServerSettings(enable_read_bucketfs=True, enable_write_bucketfs=True)
-    result = list_tools(pyexasol_connection, config, bucketfs_location)
+    result = list_tools(
+        pyexasol_connection, config, bucketfs_location, runner=event_loop_runner
+    )
 
     tool_list = {get_tool_hints(tool) for tool in result}
     expected_tool_list = {
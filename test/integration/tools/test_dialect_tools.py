@@ -1,11 +1,16 @@
+from collections.abc import (
+    Callable,
+    Generator,
+)
 from test.utils.result_utils import (
     get_list_result_json,
     get_result_json,
     verify_result_table,
 )
-from test.utils.tool_utils import run_tool
+from test.utils.tool_utils import tool_session
+from typing import Any
 
-from pyexasol import ExaConnection
+import pytest
 
 from exasol.ai.mcp.server.setup.server_settings import McpServerSettings
 from exasol.ai.mcp.server.tools.schema.db_output_schema import (
@@ -22,119 +27,114 @@ from exasol.ai.mcp.server.tools.schema.db_output_schema import (
 )
 
 
-def _run_tool(connection: ExaConnection, tool_name: str, **kwargs):
-    """Runs a tool that is always enabled and doesn't require configuration"""
-    config = McpServerSettings()
-    return run_tool(connection, config, tool_name, **kwargs)
-
-
-def _verify_result_table(
-    pyexasol_connection: ExaConnection,
-    tool_name: str,
-    key_column: str,
-    other_columns: list[str],
-    expected_keys: list[str],
-    **kwargs,
-) -> None:
-    result = _run_tool(pyexasol_connection, tool_name, **kwargs)
+@pytest.fixture(scope="module")
+def run_dialect_tool(
+    pyexasol_connection, event_loop_runner
+) -> Generator[Callable[..., Any], None, None]:
+    """
+    The dialect tools are always enabled and don't require configuration, so all
+    tests in this module share one tool session.
+    """
+    with tool_session(
+        pyexasol_connection, McpServerSettings(), event_loop_runner
+    ) as call_tool:
+        yield call_tool
+
+
+@pytest.mark.parametrize(
+    ["tool_name", "key_column", "other_columns", "expected_keys", "kwargs"],
+    [
+        (
+            "list_exasol_sql_types",
+            SQL_TYPE_FIELD,
+            [CREATE_PARAMS_FIELD, PRECISION_FIELD],
+            ["CHAR", "VARCHAR", "DECIMAL"],
+            {},
+        ),
+        (
+            "describe_exasol_built_in_function",
+            NAME_FIELD,
+            [DESCRIPTION_FIELD, CATEGORIES_FIELD, USAGE_FIELD, EXAMPLE_FIELD],
+            ["TO_DATE"],
+            {"name": "to_date"},
+        ),
+    ],
+    ids=["list_sql_types", "describe_builtin_function"],
+)
+def test_result_table(
+    run_dialect_tool, tool_name, key_column, other_columns, expected_keys, kwargs
+):
+    result = run_dialect_tool(tool_name, **kwargs)
     result_json = get_list_result_json(result)
     verify_result_table(result_json, key_column, other_columns, expected_keys)
 
 
-def test_list_sql_types(pyexasol_connection):
-    _verify_result_table(
-        pyexasol_connection,
-        "list_exasol_sql_types",
-        key_column=SQL_TYPE_FIELD,
-        other_columns=[CREATE_PARAMS_FIELD, PRECISION_FIELD],
-        expected_keys=["CHAR", "VARCHAR", "DECIMAL"],
-    )
-
-
-def test_list_system_tables(pyexasol_connection):
-    result = _run_tool(pyexasol_connection, "list_exasol_system_tables")
-    result_json = get_result_json(result)
-    assert all(
-        table_name in result_json for table_name in ["EXA_ALL_COLUMNS", "EXA_CLUSTERS"]
-    )
-
-
-def test_describe_system_table(pyexasol_connection):
-    result = _run_tool(
-        pyexasol_connection,
-        "describe_exasol_system_table",
-        table_name="exa_all_columns",
-    )
-    result_json = get_result_json(result)
-    assert all(col in result_json for col in [SCHEMA_FIELD, NAME_FIELD, COMMENT_FIELD])
-    assert result_json[SCHEMA_FIELD] == "SYS"
-    assert result_json[NAME_FIELD] == "EXA_ALL_COLUMNS"
-
-
-def test_list_statistics_tables(pyexasol_connection):
-    result = _run_tool(pyexasol_connection, "list_exasol_statistics_tables")
-    result_json = get_result_json(result)
-    assert all(
-        table_name in result_json
-        for table_name in ["EXA_SQL_DAILY", "EXA_DBA_AUDIT_SESSIONS"]
-    )
-
-
-def test_describe_statistics_tables(pyexasol_connection):
-    result = _run_tool(
-        pyexasol_connection,
-        "describe_exasol_statistics_table",
-        table_name="exa_sql_daily",
-    )
-    result_json = get_result_json(result)
-    assert all(col in result_json for col in [SCHEMA_FIELD, NAME_FIELD, COMMENT_FIELD])
-    assert result_json[SCHEMA_FIELD] == "EXA_STATISTICS"
-    assert result_json[NAME_FIELD] == "EXA_SQL_DAILY"
-
-
-def test_list_reserved_keywords(pyexasol_connection):
-    result = _run_tool(
-        pyexasol_connection, "list_exasol_keywords", reserved=True, letter="a"
-    )
-    result_json = get_result_json(result)
-    assert all(keyword.startswith("A") for keyword in result_json)
-    assert all(keyword in result_json for keyword in ["ALL", "ANY", "ARE"])
-    assert all(keyword not in result_json for keyword in ["ABS", "ADD_YEARS", "ALWAYS"])
-
-
-def test_list_non_reserved_keywords(pyexasol_connection):
-    result = _run_tool(
-        pyexasol_connection, "list_exasol_keywords", reserved=False, letter="a"
-    )
-    result_json = get_result_json(result)
-    assert all(keyword.startswith("A") for keyword in result_json)
-    assert all(keyword in result_json for keyword in ["ABS", "ADD_YEARS", "ALWAYS"])
-    assert all(keyword not in result_json for keyword in ["ALL", "ANY", "ARE"])
-
-
-def test_builtin_function_categories(pyexasol_connection):
-    result = _run_tool(pyexasol_connection, "list_exasol_built_in_function_categories")
+@pytest.mark.parametrize(
+    ["tool_name", "expected_names", "kwargs"],
+    [
+        ("list_exasol_system_tables", ["EXA_ALL_COLUMNS", "EXA_CLUSTERS"], {}),
+        (
+            "list_exasol_statistics_tables",
+            ["EXA_SQL_DAILY", "EXA_DBA_AUDIT_SESSIONS"],
+            {},
+        ),
+        (
+            "list_exasol_built_in_function_categories",
+            ["numeric", "string", "analytic"],
+            {},
+        ),
+        (
+            "list_exasol_built_in_functions",
+            ["CEILING", "DEGREES"],
+            {"category": "numeric"},
+        ),
+    ],
+    ids=[
+        "list_system_tables",
+        "list_statistics_tables",
+        "builtin_function_categories",
+        "list_builtin_functions",
+    ],
+)
+def test_list_names(run_dialect_tool, tool_name, expected_names, kwargs):
+    result = run_dialect_tool(tool_name, **kwargs)
+    result_names = set(get_result_json(result))
+    assert result_names.issuperset(expected_names)
+
+
+@pytest.mark.parametrize(
+    ["tool_name", "table_name", "expected_schema"],
+    [
+        ("describe_exasol_system_table", "exa_all_columns", "SYS"),
+        ("describe_exasol_statistics_table", "exa_sql_daily", "EXA_STATISTICS"),
+    ],
+    ids=["system_table", "statistics_table"],
+)
+def test_describe_table(run_dialect_tool, tool_name, table_name, expected_schema):
+    result = run_dialect_tool(tool_name, table_name=table_name)
     result_json = get_result_json(result)
-    assert all(
-        expected_name in result_json
-        for expected_name in ["numeric", "string", "analytic"]
-    )
+    assert result_json.keys() >= {SCHEMA_FIELD, NAME_FIELD, COMMENT_FIELD}
+    assert result_json[SCHEMA_FIELD] == expected_schema
+    assert result_json[NAME_FIELD] == table_name.upper()
 
 
-def test_list_builtin_functions(pyexasol_connection):
-    result = _run_tool(
-        pyexasol_connection, "list_exasol_built_in_functions", category="numeric"
-    )
-    result_json = get_result_json(result)
-    assert all(expected_name in result_json for expected_name in ["CEILING", "DEGREES"])
+_RESERVED_A_KEYWORDS = ["ALL", "ANY", "ARE"]
+_NON_RESERVED_A_KEYWORDS = ["ABS", "ADD_YEARS", "ALWAYS"]
 
 
-def test_describe_builtin_function(pyexasol_connection):
-    _verify_result_table(
-        pyexasol_connection,
-        "describe_exasol_built_in_function",
-        key_column=NAME_FIELD,
-        other_columns=[DESCRIPTION_FIELD, CATEGORIES_FIELD, USAGE_FIELD, EXAMPLE_FIELD],
-        expected_keys=["TO_DATE"],
-        name="to_date",
-    )
+@pytest.mark.parametrize(
+    ["reserved", "expected_keywords", "unexpected_keywords"],
+    [
+        (True, _RESERVED_A_KEYWORDS, _NON_RESERVED_A_KEYWORDS),
+        (False, _NON_RESERVED_A_KEYWORDS, _RESERVED_A_KEYWORDS),
+    ],
+    ids=["reserved", "non_reserved"],
+)
+def test_list_keywords(
+    run_dialect_tool, reserved, expected_keywords, unexpected_keywords
+):
+    result = run_dialect_tool("list_exasol_keywords", reserved=reserved, letter="a")
+    result_keywords = set(get_result_json(result))
+    assert all(keyword.startswith("A") for keyword in result_keywords)
+    assert result_keywords.issuperset(expected_keywords)
+    assert result_keywords.isdisjoint(unexpected_keywords)
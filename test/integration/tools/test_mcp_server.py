@@ -1,3 +1,7 @@
+from collections.abc import (
+    Callable,
+    Generator,
+)
 from itertools import chain
 from test.utils.db_objects import (
     ExaColumn,
@@ -15,7 +19,7 @@ from test.utils.result_utils import (
     list_tools,
     result_sort_func,
 )
-from test.utils.tool_utils import run_tool
+from test.utils.tool_utils import tool_session
 from typing import Any
 
 import pytest
@@ -64,47 +68,53 @@ def _get_expected_list_json(
     schema_name: str | None = None,
 ) -> list[dict[str, Any]]:
     no_pattern = not (conf.like_pattern or conf.regexp_pattern)
-    expected_json = [
-        _get_expected_json(db_obj, schema_name)
-        for db_obj in db_objects
-        if no_pattern or (name_part in db_obj.name)
-    ]
-    return sorted(expected_json, key=result_sort_func)
+    return sorted(
+        (
+            _get_expected_json(db_obj, schema_name)
+            for db_obj in db_objects
+            if no_pattern or (name_part in db_obj.name)
+        ),
+        key=result_sort_func,
+    )
 
 
 def _get_expected_column_list_json(
     column_list: list[ExaColumn],
 ) -> list[dict[str, Any]]:
-    expected_json = [
-        {
-            NAME_FIELD: col.name,
-            SQL_TYPE_FIELD: col.type,
-            COMMENT_FIELD: col.comment,
-        }
-        for col in column_list
-    ]
-    return sorted(expected_json, key=result_sort_func)
+    return sorted(
+        (
+            {
+                NAME_FIELD: col.name,
+                SQL_TYPE_FIELD: col.type,
+                COMMENT_FIELD: col.comment,
+            }
+            for col in column_list
+        ),
+        key=result_sort_func,
+    )
 
 
 def _get_expected_constraint_list_json(
     constraint_list: list[ExaConstraint], schema_name: str
 ) -> list[dict[str, Any]]:
-    expected_json = [
-        {
-            CONSTRAINT_NAME_FIELD: cons.name,
-            CONSTRAINT_TYPE_FIELD: cons.type,
-            CONSTRAINT_COLUMNS_FIELD: ",".join(cons.columns),
-            REFERENCED_SCHEMA_FIELD: (
-                schema_name if cons.type == "FOREIGN KEY" else None
-            ),
-            REFERENCED_TABLE_FIELD: cons.ref_table,
-            REFERENCED_COLUMNS_FIELD: (
-                None if cons.ref_columns is None else ",".join(cons.ref_columns)
-            ),
-        }
-        for cons in constraint_list
-    ]
-    return sorted(expected_json, key=result_sort_func)
+    return sorted(
+        (
+            {
+                CONSTRAINT_NAME_FIELD: cons.name,
+                CONSTRAINT_TYPE_FIELD: cons.type,
+                CONSTRAINT_COLUMNS_FIELD: ",".join(cons.columns),
+                REFERENCED_SCHEMA_FIELD: (
+                    schema_name if cons.type == "FOREIGN KEY" else None
+                ),
+                REFERENCED_TABLE_FIELD: cons.ref_table,
+                REFERENCED_COLUMNS_FIELD: (
+                    None if cons.ref_columns is None else ",".join(cons.ref_columns)
+                ),
+            }
+            for cons in constraint_list
+        ),
+        key=result_sort_func,
+    )
 
 
 def _get_expected_table_json(table: ExaTable, schema_name: str) -> dict[str, Any]:
@@ -184,13 +194,14 @@ def test_tool_disabled(
     pyexasol_connection,
     tool_name,
     meta_types,
+    event_loop_runner,
 ) -> None:
     """
     This test validates disabling a tool via the configuration.
     """
     config_dict = {meta_type: {"enable": False} for meta_type in meta_types}
     config = McpServerSettings.model_validate(config_dict)
-    result = list_tools(pyexasol_connection, config)
+    result = list_tools(pyexasol_connection, config, runner=event_loop_runner)
     tool_list = [tool.name for tool in result]
     assert tool_name not in tool_list
 
@@ -201,7 +212,12 @@ def test_tool_disabled(
     ids=["all", "like", "regexp"],
 )
 def test_list_schemas(
-    pyexasol_connection, setup_database, db_schemas, use_like, use_regexp
+    pyexasol_connection,
+    setup_database,
+    db_schemas,
+    use_like,
+    use_regexp,
+    event_loop_runner,
 ) -> None:
     """
     Test the `list_schemas` tool with various combinations of configuration parameters.
@@ -216,7 +232,8 @@ def test_list_schemas(
                 regexp_pattern=schema.name if use_regexp else "",
             )
         )
-        result = run_tool(pyexasol_connection, config, "list_exasol_schemas")
+        with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+            result = call_tool("list_exasol_schemas")
         result_json = get_list_result_json(result)
         expected_json = _get_expected_list_json([schema], schema.name, config.schemas)
         if use_like or use_regexp:
@@ -227,22 +244,21 @@ def test_list_schemas(
 
 @pytest.mark.parametrize("language", ["", "english"])
 def test_find_schemas(
-    pyexasol_connection, setup_database, db_schemas, language
+    pyexasol_connection, setup_database, db_schemas, language, event_loop_runner
 ) -> None:
     config = McpServerSettings(
         schemas=MetaListSettings(enable=True),
         language=language,
     )
-    for schema in db_schemas:
-        # Will test on new schemas only, where the result is more reliable.
-        if not schema.is_new:
-            continue
-        result = run_tool(
-            pyexasol_connection, config, "find_exasol_schemas", keywords=schema.keywords
-        )
-        result_json = get_result_json(result)[0]
-        expected_json = {NAME_FIELD: schema.name, COMMENT_FIELD: schema.comment}
-        assert result_json == expected_json
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            # Will test on new schemas only, where the result is more reliable.
+            if not schema.is_new:
+                continue
+            result = call_tool("find_exasol_schemas", keywords=schema.keywords)
+            result_json = get_result_json(result)[0]
+            expected_json = {NAME_FIELD: schema.name, COMMENT_FIELD: schema.comment}
+            assert result_json == expected_json
 
 
 @pytest.mark.parametrize(
@@ -287,6 +303,7 @@ def test_list_tables(
     use_like,
     use_regexp,
     case_sensitive,
+    event_loop_runner,
 ) -> None:
     """
     Test the `list_tables` tool with various combinations of configuration parameters.
@@ -311,29 +328,27 @@ def test_list_tables(
         ),
         case_sensitive=case_sensitive,
     )
-    for schema in db_schemas:
-        if (not schema.is_new) and (not use_like) and (not use_regexp):
-            continue
-        result = run_tool(
-            pyexasol_connection,
-            config,
-            "list_exasol_tables_and_views",
-            schema_name=_get_schema_param(schema, False, case_sensitive),
-        )
-        result_json = get_list_result_json(result)
-        expected_result: list[dict[str, Any]] = []
-        if enable_tables:
-            expected_json = _get_expected_list_json(
-                db_tables, "resort", config.tables, schema.name
-            )
-            expected_result.extend(expected_json)
-        if enable_views:
-            expected_json = _get_expected_list_json(
-                db_views, "run", config.views, schema.name
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            if (not schema.is_new) and (not use_like) and (not use_regexp):
+                continue
+            kwargs = {"schema_name": _get_schema_param(schema, False, case_sensitive)}
+            result = call_tool("list_exasol_tables_and_views", **kwargs)
+            result_json = get_list_result_json(result)
+            expected_tables: list[dict[str, Any]] = []
+            expected_views: list[dict[str, Any]] = []
+            if enable_tables:
+                expected_tables = _get_expected_list_json(
+                    db_tables, "resort", config.tables, schema.name
+                )
+            if enable_views:
+                expected_views = _get_expected_list_json(
+                    db_views, "run", config.views, schema.name
+                )
+            expected_json = sorted(
+                expected_tables + expected_views, key=result_sort_func
             )
-            expected_result.extend(expected_json)
-        expected_json = sorted(expected_result, key=result_sort_func)
-        assert result_json == expected_json
+            assert result_json == expected_json
 
 
 @pytest.mark.parametrize(
@@ -367,6 +382,7 @@ def test_find_tables(
     use_like,
     use_regexp,
     case_sensitive,
+    event_loop_runner,
 ) -> None:
     for schema in db_schemas:
         #  Will test on new schemas only, where the result can be guaranteed.
@@ -382,24 +398,19 @@ def test_find_tables(
             language=language,
             case_sensitive=case_sensitive,
         )
-        for table in chain(db_tables, db_views):
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                "find_exasol_tables_and_views",
-                keywords=table.keywords,
-                schema_name=_get_schema_param(
-                    schema, use_like or use_regexp, case_sensitive
-                ),
-            )
+        schema_name = _get_schema_param(schema, use_like or use_regexp, case_sensitive)
+        with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+            for table in chain(db_tables, db_views):
+                kwargs = {"keywords": table.keywords, "schema_name": schema_name}
+                result = call_tool("find_exasol_tables_and_views", **kwargs)
 
-            result_json = get_result_json(result)[0]
-            expected_json = {
-                NAME_FIELD: table.name,
-                COMMENT_FIELD: table.comment,
-                SCHEMA_FIELD: schema.name,
-            }
-            assert result_json == expected_json
+                result_json = get_result_json(result)[0]
+                expected_json = {
+                    NAME_FIELD: table.name,
+                    COMMENT_FIELD: table.comment,
+                    SCHEMA_FIELD: schema.name,
+                }
+                assert result_json == expected_json
 
 
 @pytest.mark.parametrize(
@@ -420,6 +431,7 @@ def test_list_functions(
     use_like,
     use_regexp,
     case_sensitive,
+    event_loop_runner,
 ) -> None:
     """
     Test the `list_functions` tool with various combinations of configuration parameters.
@@ -433,20 +445,17 @@ def test_list_functions(
         ),
         case_sensitive=case_sensitive,
     )
-    for schema in db_schemas:
-        if (not schema.is_new) and (not use_like) and (not use_regexp):
-            continue
-        result = run_tool(
-            pyexasol_connection,
-            config,
-            "list_exasol_custom_functions",
-            schema_name=_get_schema_param(schema, False, case_sensitive),
-        )
-        result_json = get_list_result_json(result)
-        expected_json = _get_expected_list_json(
-            db_functions, "cut", config.functions, schema.name
-        )
-        assert result_json == expected_json
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            if (not schema.is_new) and (not use_like) and (not use_regexp):
+                continue
+            kwargs = {"schema_name": _get_schema_param(schema, False, case_sensitive)}
+            result = call_tool("list_exasol_custom_functions", **kwargs)
+            result_json = get_list_result_json(result)
+            expected_json = _get_expected_list_json(
+                db_functions, "cut", config.functions, schema.name
+            )
+            assert result_json == expected_json
 
 
 @pytest.mark.parametrize(
@@ -479,6 +488,7 @@ def test_find_functions(
     use_like,
     use_regexp,
     case_sensitive,
+    event_loop_runner,
 ) -> None:
     for schema in db_schemas:
         # Will test on new schemas only, where the result can be guaranteed.
@@ -493,23 +503,18 @@ def test_find_functions(
             language=language,
             case_sensitive=case_sensitive,
         )
-        for func in db_functions:
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                "find_exasol_custom_functions",
-                keywords=func.keywords,
-                schema_name=_get_schema_param(
-                    schema, use_like or use_regexp, case_sensitive
-                ),
-            )
-            result_json = get_result_json(result)[0]
-            expected_json = {
-                NAME_FIELD: func.name,
-                COMMENT_FIELD: func.comment,
-                SCHEMA_FIELD: schema.name,
-            }
-            assert result_json == expected_json
+        schema_name = _get_schema_param(schema, use_like or use_regexp, case_sensitive)
+        with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+            for func in db_functions:
+                kwargs = {"keywords": func.keywords, "schema_name": schema_name}
+                result = call_tool("find_exasol_custom_functions", **kwargs)
+                result_json = get_result_json(result)[0]
+                expected_json = {
+                    NAME_FIELD: func.name,
+                    COMMENT_FIELD: func.comment,
+                    SCHEMA_FIELD: schema.name,
+                }
+                assert result_json == expected_json
 
 
 @pytest.mark.parametrize(
@@ -530,6 +535,7 @@ def test_list_scripts(
     use_like,
     use_regexp,
     case_sensitive,
+    event_loop_runner,
 ) -> None:
     """
     Test the `list_scripts` tool with various combinations of configuration parameters.
@@ -543,20 +549,17 @@ def test_list_scripts(
         ),
         case_sensitive=case_sensitive,
     )
-    for schema in db_schemas:
-        if (not schema.is_new) and (not use_like) and (not use_regexp):
-            continue
-        result = run_tool(
-            pyexasol_connection,
-            config,
-            "list_exasol_user_defined_functions",
-            schema_name=_get_schema_param(schema, False, case_sensitive),
-        )
-        result_json = get_list_result_json(result)
-        expected_json = _get_expected_list_json(
-            db_scripts, "fibo", config.scripts, schema.name
-        )
-        assert result_json == expected_json
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            if (not schema.is_new) and (not use_like) and (not use_regexp):
+                continue
+            kwargs = {"schema_name": _get_schema_param(schema, False, case_sensitive)}
+            result = call_tool("list_exasol_user_defined_functions", **kwargs)
+            result_json = get_list_result_json(result)
+            expected_json = _get_expected_list_json(
+                db_scripts, "fibo", config.scripts, schema.name
+            )
+            assert result_json == expected_json
 
 
 @pytest.mark.parametrize(
@@ -589,6 +592,7 @@ def test_find_scripts(
     use_like,
     use_regexp,
     case_sensitive,
+    event_loop_runner,
 ) -> None:
     for schema in db_schemas:
         # Will test on new schemas only, where the result can be guaranteed.
@@ -602,28 +606,28 @@ def test_find_scripts(
             scripts=MetaListSettings(enable=True),
             language=language,
         )
-        for script in db_scripts:
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                "find_exasol_user_defined_functions",
-                keywords=script.keywords,
-                schema_name=_get_schema_param(
-                    schema, use_like or use_regexp, case_sensitive
-                ),
-            )
-            result_json = get_result_json(result)[0]
-            expected_json = {
-                NAME_FIELD: script.name,
-                COMMENT_FIELD: script.comment,
-                SCHEMA_FIELD: schema.name,
-            }
-            assert result_json == expected_json
+        schema_name = _get_schema_param(schema, use_like or use_regexp, case_sensitive)
+        with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+            for script in db_scripts:
+                kwargs = {"keywords": script.keywords, "schema_name": schema_name}
+                result = call_tool("find_exasol_user_defined_functions", **kwargs)
+                result_json = get_result_json(result)[0]
+                expected_json = {
+                    NAME_FIELD: script.name,
+                    COMMENT_FIELD: script.comment,
+                    SCHEMA_FIELD: schema.name,
+                }
+                assert result_json == expected_json
 
 
 @pytest.mark.parametrize("case_sensitive", [True, False])
 def test_describe_table(
-    pyexasol_connection, setup_database, db_schemas, db_tables, case_sensitive
+    pyexasol_connection,
+    setup_database,
+    db_schemas,
+    db_tables,
+    case_sensitive,
+    event_loop_runner,
 ) -> None:
     """
     Test the `describe_table` tool. The tool is tested on each table of every schema.
@@ -634,44 +638,44 @@ def test_describe_table(
         ),
         case_sensitive=case_sensitive,
     )
-    for schema in db_schemas:
-        for table in db_tables:
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                "describe_exasol_table_or_view",
-                schema_name=_get_db_name_param(schema, case_sensitive),
-                table_name=_get_db_name_param(table, case_sensitive),
-            )
-            result_json = get_sort_result_json(result)
-            expected_json = _get_expected_table_json(table, schema.name)
-            assert result_json == expected_json
-
-
-def test_describe_sys_table(pyexasol_connection) -> None:
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            for table in db_tables:
+                kwargs = {
+                    "schema_name": _get_db_name_param(schema, case_sensitive),
+                    "table_name": _get_db_name_param(table, case_sensitive),
+                }
+                result = call_tool("describe_exasol_table_or_view", **kwargs)
+                result_json = get_sort_result_json(result)
+                expected_json = _get_expected_table_json(table, schema.name)
+                assert result_json == expected_json
+
+
+def test_describe_sys_table(pyexasol_connection, event_loop_runner) -> None:
     """
     Test the `describe_table` tool, passing the name of a system table to it.
     """
     config = McpServerSettings(columns=MetaSettings(enable=True))
-    result = run_tool(
-        pyexasol_connection,
-        config,
-        "describe_exasol_table_or_view",
-        schema_name="SYS",
-        table_name="EXA_ALL_COLUMNS",
-    )
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        result = call_tool(
+            "describe_exasol_table_or_view",
+            schema_name="SYS",
+            table_name="EXA_ALL_COLUMNS",
+        )
     result_json = get_result_json(result)
     result_columns = result_json["columns"]
-    column_names = [col[NAME_FIELD] for col in result_columns]
-    assert all(
-        expected_column in column_names
-        for expected_column in ["COLUMN_NAME", "COLUMN_TYPE", "COLUMN_COMMENT"]
-    )
+    column_names = {col[NAME_FIELD] for col in result_columns}
+    assert column_names.issuperset(["COLUMN_NAME", "COLUMN_TYPE", "COLUMN_COMMENT"])
 
 
 @pytest.mark.parametrize("case_sensitive", [True, False])
 def test_describe_view_comment(
-    pyexasol_connection, setup_database, db_schemas, db_views, case_sensitive
+    pyexasol_connection,
+    setup_database,
+    db_schemas,
+    db_views,
+    case_sensitive,
+    event_loop_runner,
 ) -> None:
     config = McpServerSettings(
         columns=MetaSettings(
@@ -679,17 +683,32 @@ def test_describe_view_comment(
         ),
         case_sensitive=case_sensitive,
     )
-    for schema in db_schemas:
-        for view in db_views:
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                "describe_exasol_table_or_view",
-                schema_name=_get_db_name_param(schema, case_sensitive),
-                table_name=_get_db_name_param(view, case_sensitive),
-            )
-            result_json = get_sort_result_json(result)
-            assert result_json[COMMENT_FIELD] == view.comment
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            for view in db_views:
+                kwargs = {
+                    "schema_name": _get_db_name_param(schema, case_sensitive),
+                    "table_name": _get_db_name_param(view, case_sensitive),
+                }
+                result = call_tool("describe_exasol_table_or_view", **kwargs)
+                result_json = get_sort_result_json(result)
+                assert result_json[COMMENT_FIELD] == view.comment
+
+
+@pytest.fixture(scope="module")
+def run_describe_tool(
+    pyexasol_connection, event_loop_runner
+) -> Generator[Callable[..., Any], None, None]:
+    """
+    The configuration with all describe tools enabled doesn't depend on the test
+    case, so the tests using this fixture share one tool session.
+    """
+    config = McpServerSettings(
+        columns=MetaSettings(enable=True),
+        parameters=MetaSettings(enable=True),
+    )
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        yield call_tool
 
 
 @pytest.mark.parametrize(
@@ -702,18 +721,14 @@ def test_describe_view_comment(
     ids=["describe_table", "describe_function", "describe_script"],
 )
 def test_describe_no_schema_name(
-    pyexasol_connection, setup_database, tool_name, other_kwargs
+    setup_database, run_describe_tool, tool_name, other_kwargs
 ) -> None:
     """
     The test validates that the `describe_xxx` tool returns an error if the schema
     is not provided.
     """
-    config = McpServerSettings(
-        columns=MetaSettings(enable=True),
-        parameters=MetaSettings(enable=True),
-    )
     with pytest.raises(ToolError):
-        run_tool(pyexasol_connection, config, tool_name=tool_name, **other_kwargs)
+        run_describe_tool(tool_name, **other_kwargs)
 
 
 @pytest.mark.parametrize(
@@ -725,29 +740,25 @@ def test_describe_no_schema_name(
     ],
 )
 def test_describe_no_db_object_name(
-    pyexasol_connection, setup_database, db_schemas, tool_name
+    setup_database, run_describe_tool, db_schemas, tool_name
 ) -> None:
     """
     The test validates that the `describe_xxx` returns an error if the name of the
     db object to be described is not provided.
     """
-    config = McpServerSettings(
-        columns=MetaSettings(enable=True),
-        parameters=MetaSettings(enable=True),
-    )
     for schema in db_schemas:
         with pytest.raises(ToolError):
-            run_tool(
-                pyexasol_connection,
-                config,
-                tool_name=tool_name,
-                schema_name=schema.name,
-            )
+            run_describe_tool(tool_name, schema_name=schema.name)
 
 
 @pytest.mark.parametrize("case_sensitive", [True, False])
 def test_describe_function(
-    pyexasol_connection, setup_database, db_schemas, db_functions, case_sensitive
+    pyexasol_connection,
+    setup_database,
+    db_schemas,
+    db_functions,
+    case_sensitive,
+    event_loop_runner,
 ) -> None:
     """
     Test the `describe_function` tool. The tool is tested on each function
@@ -759,24 +770,28 @@ def test_describe_function(
         ),
         case_sensitive=case_sensitive,
     )
-    for schema in db_schemas:
-        for func in db_functions:
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                "describe_exasol_custom_function",
-                schema_name=_get_db_name_param(schema, case_sensitive),
-                func_name=_get_db_name_param(func, case_sensitive),
-            )
-            result_json = get_result_json(result)
-            expected_json = _get_expected_param_json(func, schema.name)
-            expected_json[USAGE_FIELD] = ""
-            assert result_json == expected_json
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            for func in db_functions:
+                kwargs = {
+                    "schema_name": _get_db_name_param(schema, case_sensitive),
+                    "func_name": _get_db_name_param(func, case_sensitive),
+                }
+                result = call_tool("describe_exasol_custom_function", **kwargs)
+                result_json = get_result_json(result)
+                expected_json = _get_expected_param_json(func, schema.name)
+                expected_json[USAGE_FIELD] = ""
+                assert result_json == expected_json
 
 
 @pytest.mark.parametrize("case_sensitive", [True, False])
 def test_describe_script(
-    pyexasol_connection, setup_database, db_schemas, db_scripts, case_sensitive
+    pyexasol_connection,
+    setup_database,
+    db_schemas,
+    db_scripts,
+    case_sensitive,
+    event_loop_runner,
 ) -> None:
     """
     Test the `describe_script` tool. The tool is tested on each script
@@ -788,29 +803,29 @@ def test_describe_script(
         ),
         case_sensitive=case_sensitive,
     )
-    for schema in db_schemas:
-        for script in db_scripts:
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                "describe_exasol_user_defined_function",
-                schema_name=_get_db_name_param(schema, case_sensitive),
-                func_name=_get_db_name_param(script, case_sensitive),
-            )
-            result_json = get_result_json(result)
-            # The call example message is properly tested in the unit tests.
-            # Here we just verify that it exists.
-            assert USAGE_FIELD in result_json
-            result_json.pop(USAGE_FIELD)
-            expected_json = _get_expected_param_json(script, schema.name)
-            assert result_json == expected_json
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            for script in db_scripts:
+                kwargs = {
+                    "schema_name": _get_db_name_param(schema, case_sensitive),
+                    "func_name": _get_db_name_param(script, case_sensitive),
+                }
+                result = call_tool("describe_exasol_user_defined_function", **kwargs)
+                result_json = get_result_json(result)
+                # The call example message is properly tested in the unit tests.
+                # Here we just verify that it exists.
+                assert USAGE_FIELD in result_json
+                result_json.pop(USAGE_FIELD)
+                expected_json = _get_expected_param_json(script, schema.name)
+                assert result_json == expected_json
 
 
 def test_list_preprocessors(
-    pyexasol_connection, setup_database, db_preprocessor
+    pyexasol_connection, setup_database, db_preprocessor, event_loop_runner
 ) -> None:
     config = McpServerSettings()
-    result = run_tool(pyexasol_connection, config, "list_exasol_preprocessors")
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        result = call_tool("list_exasol_preprocessors")
     data = get_result_json(result)
     names = [p[NAME_FIELD].upper() for p in data[PREPROCESSORS_FIELD]]
     assert db_preprocessor.name.upper() in names
@@ -818,24 +833,27 @@ def test_list_preprocessors(
 
 
 def test_set_preprocessor(
-    pyexasol_connection, setup_database, db_schema_name, db_preprocessor
+    pyexasol_connection,
+    setup_database,
+    db_schema_name,
+    db_preprocessor,
+    event_loop_runner,
 ) -> None:
     config = McpServerSettings()
-    run_tool(
-        pyexasol_connection,
-        config,
-        "set_exasol_preprocessor",
-        schema_name=db_schema_name,
-        script_name=db_preprocessor.name,
-    )
-    list_result = run_tool(pyexasol_connection, config, "list_exasol_preprocessors")
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        call_tool(
+            "set_exasol_preprocessor",
+            schema_name=db_schema_name,
+            script_name=db_preprocessor.name,
+        )
+        list_result = call_tool("list_exasol_preprocessors")
     data = get_result_json(list_result)
     assert data[CURRENT_PREPROCESSOR_FIELD] is not None
     assert db_preprocessor.name.upper() in data[CURRENT_PREPROCESSOR_FIELD].upper()
 
 
 def test_summarize_table(
-    pyexasol_connection, setup_database, db_schemas, db_tables
+    pyexasol_connection, setup_database, db_schemas, db_tables, event_loop_runner
 ) -> None:
     """
     Test the `summarize_exasol_table` tool. Verifies column statistics and sample data
@@ -848,13 +866,12 @@ def test_summarize_table(
     ski_resort = next(t for t in db_tables if t.name == "ski_resort")
 
     for schema in db_schemas:
-        result = run_tool(
-            pyexasol_connection,
-            config,
-            "summarize_exasol_table",
-            schema_name=schema.name,
-            table_name=ski_resort.name,
-        )
+        with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+            result = call_tool(
+                "summarize_exasol_table",
+                schema_name=schema.name,
+                table_name=ski_resort.name,
+            )
         result_json = get_result_json(result)
 
         assert result_json[SCHEMA_FIELD] == schema.name
@@ -911,92 +928,87 @@ def test_summarize_table(
         assert len(sample) <= 10
 
 
-def test_summarize_table_disabled(pyexasol_connection) -> None:
+def test_summarize_table_disabled(pyexasol_connection, event_loop_runner) -> None:
     """
     Test that `summarize_exasol_table` is not registered when disabled.
     """
     config = McpServerSettings()  # enable_summarize_table defaults to False
-    result = list_tools(pyexasol_connection, config)
+    result = list_tools(pyexasol_connection, config, runner=event_loop_runner)
     tool_list = [tool.name for tool in result]
     assert "summarize_exasol_table" not in tool_list
 
 
-def test_execute_query(pyexasol_connection, setup_database, db_schemas, db_tables):
+def test_execute_query(
+    pyexasol_connection, setup_database, db_schemas, db_tables, event_loop_runner
+):
     """
     Test the `execute_query` tool. Runs the simplest SELECT query that grabs the entire
     content of a table and validates this content. The tool is tested on each table
     of every schema.
     """
     config = McpServerSettings(enable_read_query=True)
-    for schema in db_schemas:
-        for table in db_tables:
-            query = f'SELECT * FROM "{schema.name}"."{table.name}"'
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                tool_name="execute_exasol_query",
-                query=query,
-            )
-            if result.content:
-                result_json = get_list_result_json(result)
-            else:
-                result_json = []
-            expected_json = [
-                {col.name: col_value for col, col_value in zip(table.columns, row)}
-                for row in table.rows
-            ]
-            expected_json.sort(key=result_sort_func)
-            assert result_json == expected_json
+    # The table content is the same in every schema.
+    expected_tables: dict[str, list[dict[str, Any]]] = {}
+    for table in db_tables:
+        col_names = [col.name for col in table.columns]
+        expected_tables[table.name] = sorted(
+            (dict(zip(col_names, row)) for row in table.rows), key=result_sort_func
+        )
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            for table in db_tables:
+                query = f'SELECT * FROM "{schema.name}"."{table.name}"'
+                result = call_tool("execute_exasol_query", query=query)
+                if result.content:
+                    result_json = get_list_result_json(result)
+                else:
+                    result_json = []
+                assert result_json == expected_tables[table.name]
 
 
 def test_execute_query_error(
-    pyexasol_connection, setup_database, db_schemas, db_tables
+    pyexasol_connection, setup_database, db_schemas, db_tables, event_loop_runner
 ):
     """
     The test validates that the `execute_query` tool fails if asked to execute a
     disallowed query.
     """
     config = McpServerSettings(enable_read_query=True)
-    for schema in db_schemas:
-        for table in db_tables:
-            query = (
-                f'SELECT * INTO TABLE "{schema.name}"."ANOTHER_TABLE" '
-                f'FROM "{schema.name}"."{table.name}"'
-            )
-            with pytest.raises(ToolError):
-                run_tool(
-                    pyexasol_connection,
-                    config,
-                    tool_name="execute_exasol_query",
-                    query=query,
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            for table in db_tables:
+                query = (
+                    f'SELECT * INTO TABLE "{schema.name}"."ANOTHER_TABLE" '
+                    f'FROM "{schema.name}"."{table.name}"'
                 )
+                with pytest.raises(ToolError):
+                    call_tool("execute_exasol_query", query=query)
 
 
 def test_execute_query_with_row_limit(
-    pyexasol_connection, setup_database, db_schemas, db_tables
+    pyexasol_connection, setup_database, db_schemas, db_tables, event_loop_runner
 ):
     """
     Test that the row_limit parameter caps the number of returned rows.
     """
     config = McpServerSettings(enable_read_query=True)
     row_limit = 1
-    for schema in db_schemas:
-        for table in db_tables:
-            if not table.rows:
-                continue
-            query = f'SELECT * FROM "{schema.name}"."{table.name}"'
-            result = run_tool(
-                pyexasol_connection,
-                config,
-                tool_name="execute_exasol_query",
-                query=query,
-                row_limit=row_limit,
-            )
-            result_json = get_list_result_json(result) if result.content else []
-            assert len(result_json) <= row_limit
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        for schema in db_schemas:
+            for table in db_tables:
+                if not table.rows:
+                    continue
+                query = f'SELECT * FROM "{schema.name}"."{table.name}"'
+                result = call_tool(
+                    "execute_exasol_query", query=query, row_limit=row_limit
+                )
+                result_json = get_list_result_json(result) if result.content else []
+                assert len(result_json) <= row_limit
 
 
-def test_profile_query(pyexasol_connection, setup_database, db_schemas, db_tables):
+def test_profile_query(
+    pyexasol_connection, setup_database, db_schemas, db_tables, event_loop_runner
+):
     """
     Test that profile_exasol_query returns a non-empty execution plan for a valid query.
     """
@@ -1004,12 +1016,8 @@ def test_profile_query(pyexasol_connection, setup_database, db_schemas, db_table
     schema = db_schemas[0]
     table = db_tables[0]
     query = f'SELECT * FROM "{schema.name}"."{table.name}"'
-    result = run_tool(
-        pyexasol_connection,
-        config,
-        tool_name="profile_exasol_query",
-        query=query,
-    )
+    with tool_session(pyexasol_connection, config, event_loop_runner) as call_tool:
+        result = call_tool("profile_exasol_query", query=query)
     result_json = get_list_result_json(result)
     assert len(result_json) > 0
     assert "PART_NAME" in result_json[0]
@@ -1017,7 +1025,7 @@ def test_profile_query(pyexasol_connection, setup_database, db_schemas, db_table
 
 
 def test_profile_query_error(
-    pyexasol_connection, setup_database, db_schemas, db_tables
+    pyexasol_connection, setup_database, db_schemas, db_tables, event_loop_runner
 ):
     """
     Test that profile_exasol_query rejects non-SELECT queries.
@@ -1029,10 +1037,8 @@ def test_profile_query_error(
         f'SELECT * INTO TABLE "{schema.name}"."ANOTHER_TABLE" '
         f'FROM "{schema.name}"."{table.name}"'
     )
-    with pytest.raises(ToolError):
-        run_tool(
-            pyexasol_connection,
-            config,
-            tool_name="profile_exasol_query",
-            query=query,
-        )
+    with (
+        tool_session(pyexasol_connection, config, event_loop_runner) as call_tool,
+        pytest.raises(ToolError),
+    ):
+        call_tool("profile_exasol_query", query=query)
@@ -5,8 +5,6 @@ server internals (DSN, DB/OS username, OS name, driver/client version, session i
 to the MCP client. See GitHub issue #256.
 """
 
-from test.utils.tool_utils import run_tool
-
 import pytest
 from fastmcp.exceptions import ToolError
 
@@ -25,7 +23,7 @@ def _assert_no_sensitive_details(message: str, pyexasol_connection) -> None:
     assert pyexasol_connection.options["user"] not in message
 
 
-def test_execute_query_object_not_found_is_sanitized(pyexasol_connection):
+def test_execute_query_object_not_found_is_sanitized(pyexasol_connection, run_tool):
     """
     SELECT against a schema/table that doesn't exist raises an ExaQueryError.
     The client should see useful, query-specific detail but no connection/session
@@ -44,7 +42,7 @@ def test_execute_query_object_not_found_is_sanitized(pyexasol_connection):
     assert "NONEXISTENT_TABLE" in message
 
 
-def test_execute_query_syntax_error_is_sanitized(pyexasol_connection):
+def test_execute_query_syntax_error_is_sanitized(pyexasol_connection, run_tool):
     """
     A malformed SELECT that sqlglot's lenient parser still accepts (so it is not
     rejected by verify_query) but that the Exasol server itself rejects with a
@@ -62,7 +60,7 @@ def test_execute_query_syntax_error_is_sanitized(pyexasol_connection):
     _assert_no_sensitive_details(message, pyexasol_connection)
 
 
-def test_execute_query_multi_statement_is_sanitized(pyexasol_connection):
+def test_execute_query_multi_statement_is_sanitized(pyexasol_connection, run_tool):
     """
     Regression test for the original issue repro: "SELECT 1; SELECT 2" passes
     verify_query's sqlglot-based check (parse_one silently parses only the first
@@ -11,7 +11,7 @@ from exasol.ai.mcp.server.setup.server_settings import (
 )
 
 
-def test_tool_hints(pyexasol_connection) -> None:
+def test_tool_hints(pyexasol_connection, event_loop_runner) -> None:
     """
     This test validates hints the tool annotations.
     """
@@ -28,7 +28,7 @@ def test_tool_hints(pyexasol_connection) -> None:
         enable_write_query=True,
         enable_query_profiling=True,
     )
-    result = list_tools(pyexasol_connection, config)
+    result = list_tools(pyexasol_connection, config, runner=event_loop_runner)
 
     tool_list = {get_tool_hints(tool) for tool in result}
     expected_tool_list = {
@@ -1,42 +1,39 @@
 import asyncio
-from collections.abc import Generator
-from contextlib import contextmanager
 from test.utils.db_objects import (
     ExaColumn,
     ExaSchema,
     ExaTable,
 )
 from test.utils.sql_utils import format_table_rows
+from test.utils.tool_utils import (
+    connect_client,
+    create_test_mcp_server,
+)
 
 import pytest
-from fastmcp import Client
-from fastmcp.client.elicitation import ElicitResult
+from fastmcp import FastMCP
+from fastmcp.client.elicitation import (
+    ElicitationHandler,
+    ElicitResult,
+)
 from fastmcp.exceptions import ToolError
 from pyexasol import ExaConnection
 
-from exasol.ai.mcp.server.connection.db_connection import DbConnection
-from exasol.ai.mcp.server.main import create_mcp_server
 from exasol.ai.mcp.server.setup.server_settings import McpServerSettings
 
 CORRECT_COMMAND = "INSERT INTO"
 INCORRECT_COMMAND = "INSERT TO"
 
 
-async def _run_tool_async(
-    connection: ExaConnection, config: McpServerSettings, action: str | None, query: str
-):
+def _get_elicitation_handler(action: str | None) -> ElicitationHandler | None:
     """
-    Runs the `execute_exasol_write_query`, returning the specified action from what
-    would be a user elicitation input. If the action is None, the elicitation handler
-    is not registered. This can be used to test the case when a client application
-    does not support elicitation.
+    Creates the elicitation handler for the `execute_exasol_write_query`, returning
+    the specified action from what would be a user elicitation input. If the action
+    is None, the elicitation handler is not created. This can be used to test the
+    case when a client application does not support elicitation.
     """
-
-    @contextmanager
-    def connection_factory(
-        no_auth: bool = False,
-    ) -> Generator[ExaConnection, None, None]:
-        yield connection
+    if not action:
+        return None
 
     async def elicitation_handler(message: str, response_type: type, params, context):
         sql = params.requestedSchema["properties"]["sql"]["default"]
@@ -44,23 +41,23 @@ async def _run_tool_async(
         response_data = response_type(sql=new_sql)
         return ElicitResult(action=action, content=response_data)
 
-    db_connection = DbConnection(connection_factory, num_retries=1)
-    exa_server = create_mcp_server(db_connection, config)
-
-    el_handler = elicitation_handler if action else None
-    async with Client(exa_server, elicitation_handler=el_handler) as client:
-        return await client.call_tool("execute_exasol_write_query", {"query": query})
+    return elicitation_handler
 
 
 def _run_tool(
-    connection: ExaConnection, config: McpServerSettings, action: str | None, query: str
+    runner: asyncio.Runner, exa_server: FastMCP, action: str | None, query: str
 ):
-    return asyncio.run(_run_tool_async(connection, config, action, query))
+    el_handler = _get_elicitation_handler(action)
+    with connect_client(exa_server, runner, el_handler) as client:
+        return runner.run(
+            client.call_tool("execute_exasol_write_query", {"query": query})
+        )
 
 
 def _validate_table_creation(
+    runner: asyncio.Runner,
+    exa_server: FastMCP,
     connection: ExaConnection,
-    config: McpServerSettings,
     command: str,
     action: str | None,
     schema: ExaSchema,
@@ -73,21 +70,20 @@ def _validate_table_creation(
     In this case, the tool should return the updated query.
     """
 
+    table_values = format_table_rows(table.rows)
+
     def create_insert_query(cmd: str) -> str:
-        return (
-            f'{cmd} "{schema.name}"."{table.name}" '
-            f"VALUES {format_table_rows(table.rows)}"
-        )
+        return f'{cmd} "{schema.name}"."{table.name}" VALUES {table_values}'
 
     try:
         create_query = f"CREATE OR REPLACE TABLE {table.decl(schema.name)}"
-        result = _run_tool(connection, config, action, query=create_query)
+        result = _run_tool(runner, exa_server, action, query=create_query)
         assert result.data is None
         insert_query = create_insert_query(command)
         expected_result = (
             None if command == CORRECT_COMMAND else create_insert_query(CORRECT_COMMAND)
         )
-        result = _run_tool(connection, config, action, query=insert_query)
+        result = _run_tool(runner, exa_server, action, query=insert_query)
         assert result.data == expected_result
 
         select_query = f'SELECT * FROM "{schema.name}"."{table.name}"'
@@ -117,17 +113,34 @@ def new_table() -> ExaTable:
     )
 
 
+@pytest.fixture(scope="module")
+def write_server(pyexasol_connection) -> FastMCP:
+    """
+    The MCP server with the write query enabled. The elicitation handler is set per
+    client, so the server can be shared by all test cases that use this
+    configuration.
+    """
+    config = McpServerSettings(enable_write_query=True)
+    return create_test_mcp_server(pyexasol_connection, config)
+
+
 @pytest.mark.parametrize(
     "command", [CORRECT_COMMAND, INCORRECT_COMMAND], ids=["non-modified", "modified"]
 )
 def test_execute_write_query(
-    pyexasol_connection, setup_database, db_schemas, new_table, command
+    pyexasol_connection,
+    write_server,
+    setup_database,
+    db_schemas,
+    new_table,
+    command,
+    event_loop_runner,
 ) -> None:
-    config = McpServerSettings(enable_write_query=True)
     for schema in db_schemas:
         _validate_table_creation(
+            runner=event_loop_runner,
+            exa_server=write_server,
             connection=pyexasol_connection,
-            config=config,
             command=command,
             action="accept",
             schema=schema,
@@ -137,14 +150,20 @@ def test_execute_write_query(
 
 @pytest.mark.parametrize("action", ["decline", "cancel", None])
 def test_execute_write_query_not_accepted(
-    pyexasol_connection, setup_database, db_schemas, new_table, action
+    pyexasol_connection,
+    write_server,
+    setup_database,
+    db_schemas,
+    new_table,
+    action,
+    event_loop_runner,
 ) -> None:
-    config = McpServerSettings(enable_write_query=True)
     for schema in db_schemas:
         with pytest.raises(ToolError):
             _validate_table_creation(
+                runner=event_loop_runner,
+                exa_server=write_server,
                 connection=pyexasol_connection,
-                config=config,
                 command=CORRECT_COMMAND,
                 action=action,
                 schema=schema,
@@ -153,13 +172,15 @@ def test_execute_write_query_not_accepted(
 
 
 def test_execute_write_query_no_elicitation(
-    pyexasol_connection, setup_database, db_schemas, new_table
+    pyexasol_connection, setup_database, db_schemas, new_table, event_loop_runner
 ) -> None:
     config = McpServerSettings(enable_write_query=True, disable_elicitation=True)
+    exa_server = create_test_mcp_server(pyexasol_connection, config)
     for schema in db_schemas:
         _validate_table_creation(
+            runner=event_loop_runner,
+            exa_server=exa_server,
             connection=pyexasol_connection,
-            config=config,
             command=CORRECT_COMMAND,
             action=None,
             schema=schema,
@@ -7,6 +7,7 @@ import asyncio
 from test.integration.settings.test_mcp_oidc import OAuthHeadless
 
 import click
+import httpx
 from fastmcp import Client
 from fastmcp.client.auth.oauth import OAuth
 from fastmcp.client.transports import StreamableHttpTransport
@@ -18,16 +19,17 @@ async def _run_tool_async(
     auto_auth: bool,
     **kwargs,
 ) -> str:
-    if auto_auth:
-        oauth = OAuthHeadless(mcp_url=http_server_url)
-    else:
-        oauth = OAuth(mcp_url=http_server_url)
-    async with Client(
-        transport=StreamableHttpTransport(http_server_url), auth=oauth
-    ) as client:
-        assert await client.ping()
-        result = await client.call_tool(tool_name, kwargs)
-        return result.content[0].text
+    with httpx.Client(timeout=5.0) as http_client:
+        if auto_auth:
+            oauth = OAuthHeadless(mcp_url=http_server_url, http_client=http_client)
+        else:
+            oauth = OAuth(mcp_url=http_server_url)
+        async with Client(
+            transport=StreamableHttpTransport(http_server_url), auth=oauth
+        ) as client:
+            assert await client.ping()
+            result = await client.call_tool(tool_name, kwargs)
+            return result.content[0].text
 
 
 def _run_tool(http_server_url: str, tool_name: str, auto_auth: bool, **kwargs) -> str:
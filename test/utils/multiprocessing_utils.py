@@ -1,6 +1,15 @@
 import multiprocessing
+from collections.abc import (
+    Callable,
+    Generator,
+)
+from contextlib import (
+    ExitStack,
+    contextmanager,
+)
 
 from _pytest.monkeypatch import MonkeyPatch
+from fastmcp.utilities.tests import run_server_in_process
 
 
 def use_fork_start_method(monkeypatch: MonkeyPatch) -> None:
@@ -13,3 +22,20 @@ def use_fork_start_method(monkeypatch: MonkeyPatch) -> None:
     monkeypatch.setattr(
         multiprocessing, "Process", multiprocessing.get_context("fork").Process
     )
+
+
+@contextmanager
+def run_server_in_forked_process(
+    server_fn: Callable[..., None], *args, **kwargs
+) -> Generator[str, None, None]:
+    """
+    Same as ``run_server_in_process``, but starts the server using the "fork" method.
+    The child process inherits the already imported modules and doesn't need to pickle
+    the server function, which can be a closure. The patch is only active while the
+    process is being started.
+    """
+    with ExitStack() as stack:
+        with MonkeyPatch.context() as mp:
+            use_fork_start_method(mp)
+            url = stack.enter_context(run_server_in_process(server_fn, *args, **kwargs))
+        yield url
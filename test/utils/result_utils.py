@@ -1,6 +1,7 @@
 import asyncio
 import json
 from dataclasses import dataclass
+from functools import cache
 from typing import (
     Any,
 )
@@ -28,10 +29,15 @@ class ToolHints:
         return hash(self.tool_name)
 
 
-def result_sort_func(d: Any) -> str:
+@cache
+def _sorted_keys(keys: frozenset[str]) -> tuple[str, ...]:
+    return tuple(sorted(keys))
+
+
+def result_sort_func(d: Any) -> tuple[str, ...]:
     if isinstance(d, dict):
-        return ",".join(str(d[key]) for key in sorted(d.keys()))
-    return str(d)
+        return tuple(str(d[key]) for key in _sorted_keys(frozenset(d)))
+    return (str(d),)
 
 
 def get_result_content(result) -> str:
@@ -73,8 +79,14 @@ def list_tools(
     connection: ExaConnection,
     config: McpServerSettings,
     bucketfs_location: bfs.path.PathLike | None = None,
+    *,
+    runner: asyncio.Runner,
 ):
-    return asyncio.run(_list_tools_async(connection, config, bucketfs_location))
+    """
+    Lists the tools of an MCP server created with the provided configuration, in the
+    loop of the runner.
+    """
+    return runner.run(_list_tools_async(connection, config, bucketfs_location))
 
 
 def get_tool_hints(tool: Tool) -> ToolHints:
@@ -94,17 +106,26 @@ def verify_result_table(
     other_columns: list[str],
     expected_keys: list[str],
 ) -> None:
-    test_data = list(filter(lambda row: row[key_column] in expected_keys, result))
+    expected_key_set = set(expected_keys)
+    keys_found: set[str] = set()
+    empty_cell: tuple[str, str] | None = None
+    # Collect the expected keys and find any empty value in the other expected
+    # columns of their rows, in one pass over the output.
+    for row in result:
+        key = row[key_column]
+        if key not in expected_key_set:
+            continue
+        keys_found.add(key)
+        if empty_cell is None:
+            empty_col = next((col for col in other_columns if not row[col]), None)
+            if empty_col is not None:
+                empty_cell = (empty_col, key)
     # Verify that all expected keys are present in the output.
-    keys_found = {row[key_column] for row in test_data}
-    if keys_found != set(expected_keys):
+    if keys_found != expected_key_set:
         pytest.fail(
-            f"The expected rows {set(expected_keys).difference(keys_found)} "
+            f"The expected rows {expected_key_set.difference(keys_found)} "
             "not found in the output"
         )
-    if other_columns:
-        # Verify that there are values in all other expected columns.
-        for col_name in other_columns:
-            for row in test_data:
-                if not row[col_name]:
-                    pytest.fail(f"{col_name} is empty for {row[col_name]}")
+    # Verify that there are values in all other expected columns.
+    if empty_cell is not None:
+        pytest.fail(f"{empty_cell[0]} is empty for {empty_cell[1]}")
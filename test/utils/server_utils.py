@@ -0,0 +1,40 @@
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+
+import uvicorn
+from fastmcp import FastMCP
+
+
+@contextmanager
+def run_server_in_thread(
+    mcp_server: FastMCP, host: str, port: int, startup_timeout: float = 10.0
+) -> Generator[str, None, None]:
+    """
+    Runs the MCP server as an http server in a background thread of the current
+    process and returns the server URL. Unlike ``run_server_in_process``, this
+    doesn't need to start a new process, but the server must be created in the
+    calling process. The server is shut down when the context manager is exited.
+    """
+    config = uvicorn.Config(
+        mcp_server.http_app(),
+        host=host,
+        port=port,
+        lifespan="on",
+        log_level="warning",
+        timeout_graceful_shutdown=2,
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + startup_timeout
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError(f"Server failed to start at {host}:{port}")
+        time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
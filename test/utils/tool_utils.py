@@ -1,8 +1,17 @@
 import asyncio
-from collections.abc import Generator
+import sys
+from collections.abc import (
+    Callable,
+    Generator,
+)
 from contextlib import contextmanager
 
-from fastmcp import Client
+from fastmcp import (
+    Client,
+    FastMCP,
+)
+from fastmcp.client.client import CallToolResult
+from fastmcp.client.elicitation import ElicitationHandler
 from pyexasol import ExaConnection
 
 from exasol.ai.mcp.server.connection.db_connection import DbConnection
@@ -10,9 +19,14 @@ from exasol.ai.mcp.server.main import create_mcp_server
 from exasol.ai.mcp.server.setup.server_settings import McpServerSettings
 
 
-async def _run_tool_async(
-    connection: ExaConnection, config: McpServerSettings, tool_name: str, **kwargs
-):
+def create_test_mcp_server(
+    connection: ExaConnection, config: McpServerSettings
+) -> FastMCP:
+    """
+    Creates an MCP server that executes the queries in the provided connection.
+    The server can be reused for calling multiple tools.
+    """
+
     @contextmanager
     def connection_factory(
         no_auth: bool = False,
@@ -21,12 +35,58 @@ async def _run_tool_async(
 
     db_connection = DbConnection(connection_factory, num_retries=1)
 
-    exa_server = create_mcp_server(db_connection, config)
-    async with Client(exa_server) as client:
-        return await client.call_tool(tool_name, kwargs)
+    return create_mcp_server(db_connection, config)
+
+
+@contextmanager
+def connect_client(
+    mcp_server: FastMCP,
+    runner: asyncio.Runner,
+    elicitation_handler: ElicitationHandler | None = None,
+) -> Generator[Client, None, None]:
+    """
+    Opens a client session with the MCP server in the loop of the runner. The client
+    can be used for calling tools in this loop until the context manager exits.
+    """
+    client = Client(mcp_server, elicitation_handler=elicitation_handler)
+    runner.run(client.__aenter__())
+    try:
+        yield client
+    except BaseException:
+        runner.run(client.__aexit__(*sys.exc_info()))
+        raise
+    runner.run(client.__aexit__(None, None, None))
+
+
+@contextmanager
+def tool_session(
+    connection: ExaConnection, config: McpServerSettings, runner: asyncio.Runner
+) -> Generator[Callable[..., CallToolResult], None, None]:
+    """
+    Creates an MCP server with the provided configuration and opens a client session
+    with it in the loop of the runner. Yields a function that calls a tool by name,
+    with keyword arguments, in this session.
+    """
+    mcp_server = create_test_mcp_server(connection, config)
+    with connect_client(mcp_server, runner) as client:
+
+        def call_tool(tool_name: str, **kwargs) -> CallToolResult:
+            return runner.run(client.call_tool(tool_name, kwargs))
+
+        yield call_tool
 
 
 def run_tool(
-    connection: ExaConnection, config: McpServerSettings, tool_name: str, **kwargs
+    connection: ExaConnection,
+    config: McpServerSettings,
+    tool_name: str,
+    *,
+    runner: asyncio.Runner,
+    **kwargs,
 ):
-    return asyncio.run(_run_tool_async(connection, config, tool_name, **kwargs))
+    """
+    Creates an MCP server with the provided configuration and calls the tool in the
+    loop of the runner.
+    """
+    with tool_session(connection, config, runner) as call_tool:
+        return call_tool(tool_name, **kwargs)